@@ -4,11 +4,28 @@
 - DB에서 검사항목/검사주기 조회
 """
 import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import lru_cache, partial
+import requests
+from requests.adapters import HTTPAdapter
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import logging
 
-from config import SERVER_HOST, SERVER_PORT, LOG_FILE, LOG_FORMAT, URL_MAPPING, DISPLAY_Q_NUMBER, NUTRITION_LABEL_CATEGORIES
+# orjson import (optional) - 없으면 Flask 기본 json 사용
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+from config import SERVER_HOST, SERVER_PORT, LOG_FILE, LOG_FORMAT, LOG_LEVEL, URL_MAPPING, DISPLAY_Q_NUMBER, NUTRITION_LABEL_CATEGORIES
+from config import IMAGE_CALLBACK_WORKERS, IMAGE_SYNC_WAIT_SECONDS, KAKAO_CALLBACK_TIMEOUT
+from config import USER_STATE_TTL, USER_STATE_MAXSIZE
 from models import (
     init_database,
     has_inspection_data,
@@ -21,6 +38,7 @@ from models import (
     find_similar_items,
     find_similar_cycles,
     get_last_crawl_time,
+    clear_food_type_caches,
     can_use_vision_api,
     get_vision_api_remaining,
     get_nutrition_info,
@@ -65,29 +83,31 @@ from models import (
     get_display_value
 )
 try:
-    from vision_ocr import extract_food_type_from_image, is_vision_api_available
+    from vision_ocr import extract_food_type_from_image, is_vision_api_available, has_cached_ocr_result
     VISION_AVAILABLE = True
 except ImportError as e:
-    logging.warning(f"Vision OCR 모듈 로드 실패: {e}")
+    logging.warning("Vision OCR 모듈 로드 실패: %s", e)
     VISION_AVAILABLE = False
     def extract_food_type_from_image(url):
         return {'success': False, 'food_type': None, 'message': 'Vision API 사용 불가'}
     def is_vision_api_available():
         return False
+    def has_cached_ocr_result(url):
+        return False
 
 # NLP 검색 기능 import
 try:
     from nlp_keywords import search_qa_by_query
     NLP_AVAILABLE = True
 except ImportError as e:
-    logging.warning(f"NLP 모듈 로드 실패: {e}")
+    logging.warning("NLP 모듈 로드 실패: %s", e)
     NLP_AVAILABLE = False
     def search_qa_by_query(query, top_n=3, min_score=1):
         return []
 
 # 로깅 설정
 logging.basicConfig(
-    level=logging.INFO,
+    level=LOG_LEVEL,
     format=LOG_FORMAT,
     handlers=[
         logging.FileHandler(LOG_FILE, encoding='utf-8'),
@@ -96,21 +116,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """orjson 기반 JSON 직렬화 (jsonify / request.get_json 모두 적용)"""
+
+    _OPTIONS = orjson.OPT_NON_STR_KEYS if ORJSON_AVAILABLE else 0
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=self._OPTIONS).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # str 변환 없이 bytes를 그대로 응답 본문으로 사용
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._OPTIONS)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 # Flask 앱 생성
 app = Flask(__name__)
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
 CORS(app)
 
 # 사용자 상태 저장 (세션 관리)
-user_state = {}
+# 마지막 사용 순서로 유지하고 USER_STATE_TTL/USER_STATE_MAXSIZE를 넘은 상태는 get_user_state에서 정리
+user_state = OrderedDict()
+_user_state_seen = {}  # user_id -> 마지막 사용 시각 (time.monotonic)
 
 
-def format_korean_spacing(text: str) -> str:
-    """한국어 텍스트에 적절한 띄어쓰기 추가"""
-    if not text:
-        return text
-
-    # 조사/어미 앞에 붙어있는 단어들 사이에 띄어쓰기 추가
-    patterns = [
+# 한국어 띄어쓰기 보정 패턴 (모듈 로드 시 한 번만 컴파일, 순서대로 적용)
+# 조사/어미 앞에 붙어있는 단어들 사이에 띄어쓰기 추가
+KOREAN_SPACING_PATTERNS = tuple(
+    (re.compile(pattern), replacement) for pattern, replacement in (
         # ~에 한한다, ~에 한하며
         (r'([가-힣])에한한다', r'\1에 한한다'),
         (r'([가-힣])에한하며', r'\1에 한하며'),
@@ -136,57 +176,71 @@ def format_korean_spacing(text: str) -> str:
         (r'([0-9])초과', r'\1 초과'),
         # 단위 뒤
         (r'(mg|g|kg|ml|L|%|회)([가-힣])', r'\1 \2'),
-    ]
+    )
+)
+
+
+def format_korean_spacing(text: str) -> str:
+    """한국어 텍스트에 적절한 띄어쓰기 추가"""
+    if not text:
+        return text
 
     result = text
-    for pattern, replacement in patterns:
-        result = re.sub(pattern, replacement, result)
+    for pattern, replacement in KOREAN_SPACING_PATTERNS:
+        result = pattern.sub(replacement, result)
 
     return result
 
 
-def format_items_list(items_text: str, category: str = "식품") -> str:
-    """콤마로 구분된 항목들을 줄바꿈된 리스트 형식으로 변환
+# 항목 분리 시 확인할 문자 (괄호와 콤마만 찾고 나머지는 건너뜀)
+ITEM_DELIMITER_PATTERN = re.compile(r"[\[\](),]")
 
-    괄호 [], () 안의 콤마는 항목 구분자가 아니므로 무시
-    카테고리 헤더 (매월 1회 이상), (제품 생산 단위별) 등은 bullet 없이 표시
-    부칙 (유탕·유처리식품에 한한다) 등:
-      - 식품: 이전 항목에 같은 줄로 붙임
-      - 축산: 별도 줄에 표시 (✏️ 포함)
-    """
-    if not items_text:
-        return items_text
 
-    # 괄호 깊이를 추적하며 콤마로 분리
+def _split_top_level_items(items_text: str) -> list:
+    """괄호 [], () 밖의 콤마로 항목 분리 (괄호/콤마 위치만 훑고 항목은 슬라이스로 잘라냄)"""
     items = []
-    current_item = ""
+    start = 0
     bracket_depth = 0  # [] 깊이
     paren_depth = 0    # () 깊이
 
-    for char in items_text:
+    for match in ITEM_DELIMITER_PATTERN.finditer(items_text):
+        char = match.group()
         if char == '[':
             bracket_depth += 1
-            current_item += char
         elif char == ']':
             bracket_depth -= 1
-            current_item += char
         elif char == '(':
             paren_depth += 1
-            current_item += char
         elif char == ')':
             paren_depth -= 1
-            current_item += char
-        elif char == ',' and bracket_depth == 0 and paren_depth == 0:
+        elif bracket_depth == 0 and paren_depth == 0:
             # 괄호 밖의 콤마 -> 항목 구분자
-            if current_item.strip():
-                items.append(current_item.strip())
-            current_item = ""
-        else:
-            current_item += char
+            item = items_text[start:match.start()].strip()
+            if item:
+                items.append(item)
+            start = match.end()
 
     # 마지막 항목 추가
-    if current_item.strip():
-        items.append(current_item.strip())
+    item = items_text[start:].strip()
+    if item:
+        items.append(item)
+
+    return items
+
+
+def format_items_list(items_text: str, category: str = "식품") -> str:
+    """콤마로 구분된 항목들을 줄바꿈된 리스트 형식으로 변환
+
+    괄호 [], () 안의 콤마는 항목 구분자가 아니므로 무시
+    카테고리 헤더 (매월 1회 이상), (제품 생산 단위별) 등은 bullet 없이 표시
+    부칙 (유탕·유처리식품에 한한다) 등:
+      - 식품: 이전 항목에 같은 줄로 붙임
+      - 축산: 별도 줄에 표시 (✏️ 포함)
+    """
+    if not items_text:
+        return items_text
+
+    items = _split_top_level_items(items_text)
 
     # 부칙 패턴 (조건/제한 - 이전 항목에 붙여야 함)
     # 예: (유탕·유처리식품에 한한다), (살균제품에 한함), (발효제품은 제외한다)
@@ -630,17 +684,23 @@ def find_food_type_category(food_type: str) -> dict:
     return {"found": False}
 
 
-def is_image_url(text: str) -> bool:
-    """텍스트가 이미지 URL인지 확인"""
-    if not text:
-        return False
-    image_patterns = [
+# 이미지 URL 판별 패턴 (모듈 로드 시 한 번만 컴파일)
+IMAGE_URL_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE) for pattern in (
         r'https?://talk\.kakaocdn\.net/.*\.(jpg|jpeg|png|gif)',
         r'https?://.*kakao.*\.(jpg|jpeg|png|gif)',
         r'https?://.*\.(jpg|jpeg|png|gif)(\?.*)?$'
-    ]
-    for pattern in image_patterns:
-        if re.match(pattern, text, re.IGNORECASE):
+    )
+)
+
+
+def is_image_url(text: str) -> bool:
+    """텍스트가 이미지 URL인지 확인"""
+    # 일반 발화는 대부분 URL이 아니므로 정규식 전에 접두어로 빠르게 거름
+    if not text or not text[:8].lower().startswith(('http://', 'https://')):
+        return False
+    for pattern in IMAGE_URL_PATTERNS:
+        if pattern.match(text):
             return True
     return False
 
@@ -666,8 +726,21 @@ def get_question_label(category: str, menu_item: str) -> str:
     return "🔗 자세히 보기"
 
 
-def make_response(text: str, buttons: list = None):
-    """카카오 챗봇 응답 형식 생성"""
+# 바로가기 버튼 목록별 quickReplies 캐시 크기 (버튼 조합은 메뉴 수만큼으로 한정됨)
+QUICK_REPLIES_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=QUICK_REPLIES_CACHE_SIZE)
+def build_quick_replies(buttons: tuple) -> tuple:
+    """버튼 목록의 quickReplies 생성 (같은 버튼 조합은 캐시된 값을 공유하므로 수정하지 말 것)"""
+    return tuple(
+        {"label": btn, "action": "message", "messageText": btn}
+        for btn in buttons
+    )
+
+
+def build_response_body(text: str, buttons: list = None) -> dict:
+    """카카오 챗봇 응답 딕셔너리 생성 (직렬화 전)"""
     response = {
         "version": "2.0",
         "template": {
@@ -676,12 +749,70 @@ def make_response(text: str, buttons: list = None):
     }
 
     if buttons:
-        response["template"]["quickReplies"] = [
-            {"label": btn, "action": "message", "messageText": btn}
-            for btn in buttons
-        ]
+        response["template"]["quickReplies"] = build_quick_replies(tuple(buttons))
 
-    return jsonify(response)
+    return response
+
+
+def make_response(text: str, buttons: list = None):
+    """카카오 챗봇 응답 형식 생성"""
+    return jsonify(build_response_body(text, buttons))
+
+
+def encode_response_body(body: dict) -> bytes:
+    """응답 본문을 JSON bytes로 직렬화 (orjson이면 str 변환/재인코딩 없이 바로 bytes)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(body, default=app.json.default, option=OrjsonProvider._OPTIONS)
+    return app.json.dumps(body).encode("utf-8")
+
+
+def make_cached_response(body: bytes):
+    """미리 직렬화된 응답 본문으로 JSON 응답 생성"""
+    return app.response_class(body, mimetype=app.json.mimetype)
+
+
+# 검사항목/검사주기 단건 결과 응답 캐시 크기
+RESULT_RESPONSE_CACHE_SIZE = 4096
+
+# 이미지 분석을 콜백으로 처리할 때 즉시 보내는 응답 (결과는 callbackUrl로 전송)
+IMAGE_CALLBACK_ACK_BODY = {
+    "version": "2.0",
+    "useCallback": True,
+    "data": {"text": "📷 이미지를 분석하고 있습니다. 잠시만 기다려주세요."}
+}
+
+# 이미지 분석 백그라운드 실행기
+# (wsgi.py에서 gevent monkey patch 후 import되므로 워커 스레드도 gevent와 협력,
+#  스레드는 첫 submit 시점에 생성되므로 --preload fork 전에 만들어도 무방)
+_image_search_executor = ThreadPoolExecutor(
+    max_workers=IMAGE_CALLBACK_WORKERS, thread_name_prefix="image-search"
+)
+
+# 카카오 콜백 전송용 HTTP 세션 (같은 콜백 서버로의 keep-alive 연결 재사용)
+# POST는 재시도하면 사용자에게 같은 답변이 중복 전송될 수 있으므로 재시도하지 않음
+_callback_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=IMAGE_CALLBACK_WORKERS)
+_callback_session = requests.Session()
+_callback_session.mount("https://", _callback_adapter)
+_callback_session.mount("http://", _callback_adapter)
+
+
+@lru_cache(maxsize=RESULT_RESPONSE_CACHE_SIZE)
+def render_inspection_item_result(category: str, food_type: str, items: str) -> bytes:
+    """검사항목 단건 결과 응답 본문 생성 (DB 내용을 키로 캐시하므로 재크롤링 시 자동 갱신)"""
+    formatted_items = format_items_list(items, category)
+    response_text = f"✅ [{food_type}]의 검사 항목:\n\n{formatted_items}"
+    response_text += f"\n\n📌 다른 식품 유형을 입력하거나, [종료]를 눌러주세요."
+    return encode_response_body(build_response_body(response_text, ["종료"]))
+
+
+@lru_cache(maxsize=RESULT_RESPONSE_CACHE_SIZE)
+def render_inspection_cycle_result(food_group: str, food_type: str, cycle: str) -> bytes:
+    """검사주기 단건 결과 응답 본문 생성 (DB 내용을 키로 캐시하므로 재크롤링 시 자동 갱신)"""
+    formatted_cycle = format_korean_spacing(cycle)
+    formatted_food_type = format_korean_spacing(food_type)
+    response_text = f"✅ [{food_group}] {formatted_food_type}의 검사주기:\n\n{formatted_cycle}"
+    response_text += f"\n\n📌 다른 식품 유형을 입력하거나, [종료]를 눌러주세요."
+    return encode_response_body(build_response_body(response_text, ["종료"]))
 
 
 def make_response_with_link(text: str, link_label: str, link_url: str, buttons: list = None):
@@ -714,10 +845,7 @@ def make_response_with_link(text: str, link_label: str, link_url: str, buttons:
     }
 
     if buttons:
-        response["template"]["quickReplies"] = [
-            {"label": btn, "action": "message", "messageText": btn}
-            for btn in buttons
-        ]
+        response["template"]["quickReplies"] = build_quick_replies(tuple(buttons))
 
     return jsonify(response)
 
@@ -763,10 +891,7 @@ def make_carousel_response(cards: list, quick_replies: list = None):
     }
 
     if quick_replies:
-        response["template"]["quickReplies"] = [
-            {"label": btn, "action": "message", "messageText": btn}
-            for btn in quick_replies
-        ]
+        response["template"]["quickReplies"] = build_quick_replies(tuple(quick_replies))
 
     return jsonify(response)
 
@@ -803,10 +928,7 @@ def make_list_card_response(header: str, items: list, quick_replies: list = None
     }
 
     if quick_replies:
-        response["template"]["quickReplies"] = [
-            {"label": btn, "action": "message", "messageText": btn}
-            for btn in quick_replies
-        ]
+        response["template"]["quickReplies"] = build_quick_replies(tuple(quick_replies))
 
     return jsonify(response)
 
@@ -865,10 +987,7 @@ def make_carousel_with_links_response(title: str, data_sections: list, quick_rep
     }
 
     if quick_replies:
-        response["template"]["quickReplies"] = [
-            {"label": btn, "action": "message", "messageText": btn}
-            for btn in quick_replies
-        ]
+        response["template"]["quickReplies"] = build_quick_replies(tuple(quick_replies))
 
     return jsonify(response)
 
@@ -1116,7 +1235,7 @@ def handle_admin_command(user_id: str, command: str) -> str:
     # 첫 번째 !명령어 사용자는 자동으로 관리자 등록 (관리자가 없는 경우)
     if not has_any_admin():
         add_admin_user(user_id, "초기관리자")
-        logger.info(f"[{user_id}] 초기 관리자로 자동 등록")
+        logger.info("[%s] 초기 관리자로 자동 등록", user_id)
 
     # 관리자 권한 확인
     if not is_admin_user(user_id):
@@ -1149,6 +1268,7 @@ def handle_admin_command(user_id: str, command: str) -> str:
 [시스템]
 !통계 : Q&A/미답변 통계
 !API사용량 : Vision API 사용량
+!캐시초기화 : 크롤링 데이터 즉시 반영
 !관리자추가 유저ID : 관리자 추가
 !관리자목록 : 관리자 목록"""
 
@@ -1400,6 +1520,12 @@ def handle_admin_command(user_id: str, command: str) -> str:
         else:
             return f"❌ Q&A #{qa_id} 활성화 실패"
 
+    # !캐시초기화
+    if cmd == "!캐시초기화":
+        clear_food_type_caches()
+        logger.info("[%s] 식품유형 검색 캐시 초기화", user_id)
+        return "✅ 검색 캐시 초기화 완료!\n최근 크롤링한 검사항목/검사주기가 바로 반영됩니다."
+
     # !API사용량
     if cmd == "!API사용량":
         remaining = get_vision_api_remaining()
@@ -1417,6 +1543,34 @@ def handle_admin_command(user_id: str, command: str) -> str:
     return f"❌ 알 수 없는 명령어: {cmd}\n!도움말 로 명령어 목록을 확인하세요."
 
 
+# 사용자별 "이전" 히스토리 최대 보관 개수
+MAX_HISTORY_DEPTH = 10
+
+
+def _expire_user_states(now: float):
+    """오래 사용하지 않은 사용자 상태 삭제 (가장 오래된 것부터, 만료/개수 초과가 없으면 중단)"""
+    while user_state:
+        oldest = next(iter(user_state))
+        if (len(user_state) <= USER_STATE_MAXSIZE and
+                now - _user_state_seen.get(oldest, now) <= USER_STATE_TTL):
+            break
+        user_state.pop(oldest, None)
+        _user_state_seen.pop(oldest, None)
+
+
+def get_user_state(user_id: str) -> dict:
+    """사용자 상태 조회 (없거나 만료되었으면 새로 생성하고 마지막 사용 시각 갱신)"""
+    now = time.monotonic()
+    user_data = user_state.get(user_id)
+    if user_data is None or now - _user_state_seen.get(user_id, now) > USER_STATE_TTL:
+        user_data = {"히스토리": []}
+        user_state[user_id] = user_data
+    user_state.move_to_end(user_id)
+    _user_state_seen[user_id] = now
+    _expire_user_states(now)
+    return user_data
+
+
 def reset_user_state(user_id: str):
     """사용자 상태 초기화"""
     user_state[user_id] = {"히스토리": []}
@@ -1430,9 +1584,15 @@ def save_to_history(user_data: dict):
     # 현재 상태 복사 (히스토리 제외)
     current_state = {k: v for k, v in user_data.items() if k != "히스토리"}
 
-    # 빈 상태는 저장하지 않음
-    if current_state:
-        user_data["히스토리"].append(current_state.copy())
+    # 빈 상태 또는 직전과 같은 상태는 저장하지 않음
+    history = user_data["히스토리"]
+    if not current_state or (history and history[-1] == current_state):
+        return
+    history.append(current_state)
+
+    # 사용자별 메모리 사용량 제한: 오래된 히스토리부터 버림
+    if len(history) > MAX_HISTORY_DEPTH:
+        del history[:-MAX_HISTORY_DEPTH]
 
 
 def go_back(user_data: dict) -> dict:
@@ -1559,6 +1719,302 @@ def _calculate_serving_display(user_data: dict):
     return make_response(result_text, ["표시단위 계산", "이전", "처음으로"])
 
 
+# ===== 결제수단 / 상담원 연결 고정 응답 =====
+WELCOME_TEXT = (
+    "안녕하세요! 바이오푸드랩 챗봇[바푸]입니다.\n\n"
+    "🔬 검사분야 버튼으로 분야별 검색 가능\n"
+    "⚡ 퀵 메뉴 검사주기, 검사항목으로 빠른 조회\n"
+    "🧮 영양성분 메뉴에서 함량, 당알코올 함량 계산\n"
+    "💡 버튼 외 자연어로 질문하셔도 됩니다!\n\n"
+    "자세한 상담은 채팅방 메뉴에서 \"채널 이동\"을 누르시면 상담이 가능한 채널로 이동합니다.\n"
+    "(업무 시간 09:00~17:30)\n\n"
+    "개발자 : @BP_K"
+)
+WELCOME_BUTTONS = ("검사분야", "검사주기", "검사항목")
+
+BANK_ACCOUNTS = {
+    "기업은행": "024-088021-01-017",
+    "우리은행": "1005-702-799176",
+    "농협은행": "301-0178-1722-11"
+}
+BANK_BUTTONS = ("기업은행", "우리은행", "농협은행", "처음으로")
+BANK_ACCOUNT_TEMPLATE = (
+    "🏦 {bank} 계좌번호\n\n"
+    "📋 {account}\n\n"
+    "━━━━━━━━━━━━━━━\n"
+    "★ 입금시 '대표자명' 또는 '업체명'으로 입금 부탁드립니다.\n\n"
+    "★ 업체명으로 입금 진행시, [농업회사법인 주식회사]에서 잘리는 경우가 있습니다. "
+    "이와 같은 경우, 입금 확인이 늦어질 수 있으니 업체명을 식별할 수 있도록 표시 부탁드립니다."
+)
+CARD_PAYMENT_TEXT = (
+    "💳 카드 결제 안내\n\n"
+    "1. 방문 결제\n"
+    "2. 토스 링크페이 결제\n"
+    "3. 홈페이지 통하여 검사 진행 후, 마이페이지 카드 결제\n\n"
+    "━━━━━━━━━━━━━━━\n"
+    "* 영수증이 필요하신 분은 결제 창에서 이메일을 작성하셔야 합니다."
+)
+BANKBOOK_COPY_TEXT = (
+    "📄 통장 사본 안내\n\n"
+    "통장 사본은 [자료실-문서자료실] 18번 게시글을 통하여 다운로드 가능합니다.\n\n"
+    "🔗 홈페이지: www.biofl.co.kr"
+)
+COUNSELOR_TEXT = (
+    "👩‍💼 상담원 연결 안내\n\n"
+    "⏰ 상담 가능 시간\n"
+    "평일 09:00 ~ 17:00\n\n"
+    "━━━━━━━━━━━━━━━\n"
+    "아래 링크를 클릭하여 상담원과 연결하세요.\n\n"
+    "🔗 http://pf.kakao.com/_uCxnvxl/chat"
+)
+PAYMENT_BUTTONS = ("결제수단", "처음으로")
+
+
+def _handle_payment_menu(user_data: dict, user_input: str):
+    """결제수단 메뉴"""
+    user_data["기능"] = "결제수단"
+    return make_response(
+        "💳 결제수단을 선택해주세요.",
+        ("계좌번호", "카드결제", "통장사본", "처음으로")
+    )
+
+
+def _handle_account_menu(user_data: dict, user_input: str):
+    """계좌번호 선택 → 은행 선택"""
+    user_data["기능"] = "결제수단"
+    user_data["결제"] = "계좌번호"
+    return make_response("🏦 은행을 선택해주세요.", BANK_BUTTONS)
+
+
+def _handle_bank_account(user_data: dict, user_input: str):
+    """은행 선택 → 계좌번호 표시"""
+    response_text = BANK_ACCOUNT_TEMPLATE.format(
+        bank=user_input,
+        account=BANK_ACCOUNTS.get(user_input, "")
+    )
+    return make_response(response_text, ("다른은행", "결제수단", "처음으로"))
+
+
+def _handle_other_bank(user_data: dict, user_input: str):
+    """다른은행 선택"""
+    return make_response("🏦 은행을 선택해주세요.", BANK_BUTTONS)
+
+
+def _handle_card_payment(user_data: dict, user_input: str):
+    """카드결제 안내"""
+    return make_response(CARD_PAYMENT_TEXT, PAYMENT_BUTTONS)
+
+
+def _handle_bankbook_copy(user_data: dict, user_input: str):
+    """통장사본 안내"""
+    return make_response(BANKBOOK_COPY_TEXT, PAYMENT_BUTTONS)
+
+
+def _handle_counselor(user_data: dict, user_input: str):
+    """상담원 연결 안내"""
+    return make_response(COUNSELOR_TEXT, ("처음으로",))
+
+
+# 상태와 무관하게 입력값만으로 응답이 정해지는 명령어 (입력값 → 핸들러)
+STATIC_COMMAND_HANDLERS = {
+    "결제수단": _handle_payment_menu,
+    "결제정보": _handle_payment_menu,
+    "계좌번호": _handle_account_menu,
+    "기업은행": _handle_bank_account,
+    "우리은행": _handle_bank_account,
+    "농협은행": _handle_bank_account,
+    "다른은행": _handle_other_bank,
+    "카드결제": _handle_card_payment,
+    "통장사본": _handle_bankbook_copy,
+    "상담원 연결": _handle_counselor,
+}
+
+
+def _handle_select_function(user_data: dict, user_input: str):
+    """Step 1: 기능 선택 (검사주기/검사항목)"""
+    save_to_history(user_data)  # 히스토리 저장
+    user_data["기능"] = user_input
+    user_data.pop("분야", None)
+    user_data.pop("업종", None)
+    return make_response(
+        f"[{user_input}] 검사할 분야를 선택해주세요.",
+        ["식품", "축산", "이전", "처음으로"]
+    )
+
+
+def _handle_select_field(user_data: dict, user_input: str):
+    """Step 2: 분야 선택 (식품/축산)"""
+    if "기능" not in user_data:
+        return make_response(
+            "먼저 원하시는 서비스를 선택해주세요.",
+            ["검사주기", "검사항목"]
+        )
+
+    save_to_history(user_data)  # 히스토리 저장
+    user_data["분야"] = user_input
+
+    # 식품유형 힌트 확인
+    food_hint = user_data.get("식품유형_힌트")
+
+    if user_data["기능"] == "검사주기":
+        # 검사주기: 업종 선택 필요
+        if user_input == "식품":
+            buttons = ["식품제조가공업", "즉석판매제조가공업", "이전", "처음으로"]
+        else:
+            buttons = ["축산물제조가공업", "축산물즉석판매제조가공업", "이전", "처음으로"]
+        return make_response(
+            f"[{user_input}] 검사할 업종을 선택해주세요.",
+            buttons
+        )
+    else:
+        # 검사항목: 바로 식품 유형 입력
+        msg = f"[{user_input}] 검사할 식품 유형을 입력해주세요.\n\n예: 과자, 음료, 소시지 등\n\n(주의 : 품목제조보고서에 표기된 \"식품유형\"을 입력하세요. 단어에 가운데 점이 있는 경우 제외하고 입력하세요)"
+        if food_hint:
+            msg += f"\n\n💡 '{food_hint}'(으)로 검색하시려면 그대로 입력해주세요."
+        return make_response(msg, ["이전", "처음으로"])
+
+
+def _handle_select_industry(user_data: dict, user_input: str):
+    """Step 3: 업종 선택 (검사주기만 해당)"""
+    if user_data.get("기능") != "검사주기":
+        return make_response(
+            "먼저 원하시는 서비스를 선택해주세요.",
+            ["검사주기", "검사항목"]
+        )
+
+    save_to_history(user_data)  # 히스토리 저장
+    user_data["업종"] = user_input
+
+    # 식품유형 힌트 확인
+    food_hint = user_data.get("식품유형_힌트")
+    hint_msg = f"\n\n💡 '{food_hint}'(으)로 검색하시려면 그대로 입력해주세요." if food_hint else ""
+
+    # 식품제조가공업, 축산물제조가공업은 품목제조보고서 주의 메시지
+    if user_input in ["식품제조가공업", "축산물제조가공업"]:
+        msg = f"[{user_input}] 검사할 식품 유형을 입력해주세요.\n\n예: 과자, 음료, 소시지 등\n\n(주의 : 품목제조보고서에 표기된 \"식품유형\"을 입력하세요. 단어에 가운데 점이 있는 경우 제외하고 입력하세요)"
+        return make_response(msg + hint_msg, ["이전", "처음으로"])
+    elif user_input == "즉석판매제조가공업":
+        # 즉석판매제조가공업은 영업신고증 주의 메시지 + 바로가기 버튼
+        message = f"[{user_input}] 검사할 식품 유형을 입력해주세요.\n\n"
+        message += "예: 과자, 음료, 소시지 등\n\n"
+        message += "(주의 : 영업신고증에 표기된 \"식품유형\"을 입력하세요. 단어에 가운데 점이 있는 경우 제외하고 입력하세요.)\n\n"
+        message += "* 주의 즉석판매제조가공업은 영업등록증에 표기된 식품의 유형만 자가품질검사 대상이 됩니다.\n\n"
+        message += "대상은 바로가기 버튼을 클릭하여 Q5. [즉석판매제조가공업] 자가품질검사 대상식품 및 검사주기를 참고해주세요."
+        message += hint_msg
+        return make_response_with_link(
+            message,
+            "바로가기",
+            "https://www.biofl.co.kr/sub.jsp?code=7r9P7y94",
+            ["이전", "처음으로"]
+        )
+    else:
+        # 축산물즉석판매제조가공업은 신고필증 주의 메시지 + 바로가기 버튼
+        message = f"[{user_input}] 검사할 식품 유형을 입력해주세요.\n\n"
+        message += "예: 과자, 음료, 소시지 등\n\n"
+        message += "(주의 : 신고필증에 표기된 \"식품유형\"을 입력하세요. 단어에 가운데 점이 있는 경우 제외하고 입력하세요.)\n\n"
+        message += "* 주의 축산물즉석판매제조가공업은 신고필증에 표기된 식품의 유형을 확인해주시고 바로가기 버튼을 클릭하여 \"Q5. [식육즉석판매가공업] 자가품질검사 대상식품 및 검사주기\"를 참고해 주세요."
+        message += hint_msg
+        return make_response_with_link(
+            message,
+            "바로가기",
+            "https://www.biofl.co.kr/sub.jsp?code=XN0Cd4r7",
+            ["이전", "처음으로"]
+        )
+
+
+# 검사주기/검사항목 단계별 선택 (입력값 → 핸들러, 현재 상태는 핸들러에서 확인)
+INSPECTION_STEP_HANDLERS = {
+    "검사주기": _handle_select_function,
+    "검사항목": _handle_select_function,
+    "식품": _handle_select_field,
+    "축산": _handle_select_field,
+    "식품제조가공업": _handle_select_industry,
+    "즉석판매제조가공업": _handle_select_industry,
+    "축산물제조가공업": _handle_select_industry,
+    "축산물즉석판매제조가공업": _handle_select_industry,
+}
+
+
+def build_image_search_body(user_id: str, user_data: dict, image_url: str) -> dict:
+    """업로드 이미지에서 식품유형을 추출해 검사항목/검사주기 응답 본문 생성
+
+    Returns:
+        응답 본문 dict 또는 None (현재 단계에서 이미지 결과를 보여줄 수 없는 경우)
+    """
+    # 이미지에서 식품유형 추출 시도
+    ocr_result = extract_food_type_from_image(image_url)
+
+    if ocr_result['success'] and ocr_result['food_type']:
+        food_type = ocr_result['food_type']
+        logger.info("[%s] OCR 식품유형: %s", user_id, food_type)
+
+        # 추출된 식품유형으로 검색
+        if user_data["기능"] == "검사항목":
+            result = get_inspection_item(user_data["분야"], food_type)
+            if result:
+                user_data["실패횟수"] = 0
+                formatted_items = format_items_list(result['items'], user_data["분야"])
+                response_text = f"📷 이미지에서 '{food_type}'을(를) 찾았습니다.\n\n"
+                response_text += f"✅ [{result['food_type']}]의 검사 항목:\n\n{formatted_items}"
+                response_text += f"\n\n📌 다른 식품 유형을 입력하거나, [종료]를 눌러주세요."
+                return build_response_body(response_text, ["종료"])
+            else:
+                # 이미지에서 추출했지만 DB에 없는 경우
+                similar = find_similar_items(user_data["분야"], food_type)
+                response_text = f"📷 이미지에서 '{food_type}'을(를) 찾았습니다.\n\n"
+                response_text += f"❌ 하지만 '{food_type}'에 대한 검사 항목을 찾을 수 없습니다."
+                if similar:
+                    response_text += f"\n\n🔍 유사한 항목: {', '.join(similar)}"
+                return build_response_body(response_text, ["종료"])
+
+        elif user_data["기능"] == "검사주기" and user_data.get("업종"):
+            result = get_inspection_cycle(user_data["분야"], user_data["업종"], food_type)
+            if result:
+                user_data["실패횟수"] = 0
+                formatted_cycle = format_korean_spacing(result['cycle'])
+                formatted_food_type = format_korean_spacing(result['food_type'])
+                response_text = f"📷 이미지에서 '{food_type}'을(를) 찾았습니다.\n\n"
+                response_text += f"✅ [{result['food_group']}] {formatted_food_type}의 검사주기:\n\n{formatted_cycle}"
+                response_text += f"\n\n📌 다른 식품 유형을 입력하거나, [종료]를 눌러주세요."
+                return build_response_body(response_text, ["종료"])
+            else:
+                similar = find_similar_cycles(user_data["분야"], user_data["업종"], food_type)
+                response_text = f"📷 이미지에서 '{food_type}'을(를) 찾았습니다.\n\n"
+                response_text += f"❌ 하지만 '{food_type}'에 대한 검사주기를 찾을 수 없습니다."
+                if similar:
+                    response_text += f"\n\n🔍 유사한 항목: {', '.join(similar)}"
+                return build_response_body(response_text, ["종료"])
+    else:
+        # OCR 실패
+        response_text = f"📷 {ocr_result['message']}\n\n"
+        response_text += "식품유형을 직접 입력해주세요."
+        return build_response_body(response_text, ["종료"])
+
+    # 현재 단계에서 처리할 수 없는 경우 (일반 입력 처리로 넘김)
+    return None
+
+
+def _send_image_search_callback(callback_url: str, user_id: str, future):
+    """이미지 분석이 끝나면 결과를 카카오 콜백 URL로 전송 (future 완료 시 호출)"""
+    try:
+        body = future.result()
+    except Exception as e:
+        logger.error("[%s] 이미지 분석 오류: %s", user_id, e)
+        body = None
+    if body is None:
+        body = build_response_body("📷 이미지를 처리할 수 없습니다.\n\n식품유형을 직접 입력해주세요.", ["종료"])
+
+    try:
+        response = _callback_session.post(
+            callback_url,
+            data=encode_response_body(body),
+            headers={"Content-Type": "application/json"},
+            timeout=KAKAO_CALLBACK_TIMEOUT
+        )
+        if response.status_code != 200:
+            logger.warning("[%s] 콜백 응답 오류: HTTP %s", user_id, response.status_code)
+    except Exception as e:
+        logger.error("[%s] 콜백 전송 실패: %s", user_id, e)
 
 
 @app.route('/chatbot', methods=['POST'])
@@ -1580,27 +2036,22 @@ def chatbot():
         # 텍스트 입력이 이미지 URL인 경우도 처리
         if not image_url and user_input and is_image_url(user_input):
             image_url = user_input
-            logger.info(f"[{user_id}] 텍스트로 전달된 이미지 URL 감지")
+            logger.info("[%s] 텍스트로 전달된 이미지 URL 감지", user_id)
 
-        logger.info(f"[{user_id}] 입력: {user_input[:100] if user_input else 'None'}" + (f" (이미지: {image_url[:50]}...)" if image_url else ""))
+        if image_url:
+            logger.info("[%s] 입력: %.100s (이미지: %.50s...)", user_id, user_input or "None", image_url)
+        else:
+            logger.info("[%s] 입력: %.100s", user_id, user_input or "None")
 
-        # 사용자 상태 초기화
-        if user_id not in user_state:
-            user_state[user_id] = {"히스토리": []}
-        user_data = user_state[user_id]
+        # 사용자 상태 조회 (없으면 초기화)
+        user_data = get_user_state(user_id)
         if "히스토리" not in user_data:
             user_data["히스토리"] = []
 
-        # 기본 버튼
-        default_buttons = ["검사주기", "검사항목", "처음으로"]
-
         # "처음으로" 또는 "종료" 입력 시 상태 초기화
         if user_input in ["처음으로", "종료"]:
             reset_user_state(user_id)
-            return make_response(
-                "안녕하세요! 바이오푸드랩 챗봇[바푸]입니다.\n\n🔬 검사분야 버튼으로 분야별 검색 가능\n⚡ 퀵 메뉴 검사주기, 검사항목으로 빠른 조회\n🧮 영양성분 메뉴에서 함량, 당알코올 함량 계산\n💡 버튼 외 자연어로 질문하셔도 됩니다!\n\n자세한 상담은 채팅방 메뉴에서 \"채널 이동\"을 누르시면 상담이 가능한 채널로 이동합니다.\n(업무 시간 09:00~17:30)\n\n개발자 : @BP_K",
-                ["검사분야", "검사주기", "검사항목"]
-            )
+            return make_response(WELCOME_TEXT, WELCOME_BUTTONS)
 
         # ===== 관리자 명령어 처리 (! 로 시작) =====
         if user_input.startswith("!"):
@@ -5282,214 +5733,33 @@ FT-IR로 분석하여 Glycerol, Cellulose(섬유질) 등을 확인하여 식품
 
         # ===== 이미지 업로드 처리 =====
         if image_url and user_data.get("기능") and user_data.get("분야"):
-            # 이미지에서 식품유형 추출 시도
-            ocr_result = extract_food_type_from_image(image_url)
-
-            if ocr_result['success'] and ocr_result['food_type']:
-                food_type = ocr_result['food_type']
-                logger.info(f"[{user_id}] OCR 식품유형: {food_type}")
-
-                # 추출된 식품유형으로 검색
-                if user_data["기능"] == "검사항목":
-                    result = get_inspection_item(user_data["분야"], food_type)
-                    if result:
-                        user_data["실패횟수"] = 0
-                        formatted_items = format_items_list(result['items'], user_data["분야"])
-                        response_text = f"📷 이미지에서 '{food_type}'을(를) 찾았습니다.\n\n"
-                        response_text += f"✅ [{result['food_type']}]의 검사 항목:\n\n{formatted_items}"
-                        response_text += f"\n\n📌 다른 식품 유형을 입력하거나, [종료]를 눌러주세요."
-                        return make_response(response_text, ["종료"])
-                    else:
-                        # 이미지에서 추출했지만 DB에 없는 경우
-                        similar = find_similar_items(user_data["분야"], food_type)
-                        response_text = f"📷 이미지에서 '{food_type}'을(를) 찾았습니다.\n\n"
-                        response_text += f"❌ 하지만 '{food_type}'에 대한 검사 항목을 찾을 수 없습니다."
-                        if similar:
-                            response_text += f"\n\n🔍 유사한 항목: {', '.join(similar)}"
-                        return make_response(response_text, ["종료"])
-
-                elif user_data["기능"] == "검사주기" and user_data.get("업종"):
-                    result = get_inspection_cycle(user_data["분야"], user_data["업종"], food_type)
-                    if result:
-                        user_data["실패횟수"] = 0
-                        formatted_cycle = format_korean_spacing(result['cycle'])
-                        formatted_food_type = format_korean_spacing(result['food_type'])
-                        response_text = f"📷 이미지에서 '{food_type}'을(를) 찾았습니다.\n\n"
-                        response_text += f"✅ [{result['food_group']}] {formatted_food_type}의 검사주기:\n\n{formatted_cycle}"
-                        response_text += f"\n\n📌 다른 식품 유형을 입력하거나, [종료]를 눌러주세요."
-                        return make_response(response_text, ["종료"])
-                    else:
-                        similar = find_similar_cycles(user_data["분야"], user_data["업종"], food_type)
-                        response_text = f"📷 이미지에서 '{food_type}'을(를) 찾았습니다.\n\n"
-                        response_text += f"❌ 하지만 '{food_type}'에 대한 검사주기를 찾을 수 없습니다."
-                        if similar:
-                            response_text += f"\n\n🔍 유사한 항목: {', '.join(similar)}"
-                        return make_response(response_text, ["종료"])
-            else:
-                # OCR 실패
-                response_text = f"📷 {ocr_result['message']}\n\n"
-                response_text += "식품유형을 직접 입력해주세요."
-                return make_response(response_text, ["종료"])
-
-        # ===== 결제수단 기능 =====
-        if user_input in ["결제수단", "결제정보"]:
-            user_data["기능"] = "결제수단"
-            return make_response(
-                "💳 결제수단을 선택해주세요.",
-                ["계좌번호", "카드결제", "통장사본", "처음으로"]
-            )
-
-        # 계좌번호 선택
-        if user_input == "계좌번호":
-            user_data["기능"] = "결제수단"
-            user_data["결제"] = "계좌번호"
-            return make_response(
-                "🏦 은행을 선택해주세요.",
-                ["기업은행", "우리은행", "농협은행", "처음으로"]
-            )
-
-        # 은행 선택 → 계좌번호 표시
-        if user_input in ["기업은행", "우리은행", "농협은행"]:
-            bank_info = {
-                "기업은행": "024-088021-01-017",
-                "우리은행": "1005-702-799176",
-                "농협은행": "301-0178-1722-11"
-            }
-            account = bank_info.get(user_input, "")
-            response_text = f"🏦 {user_input} 계좌번호\n\n"
-            response_text += f"📋 {account}\n\n"
-            response_text += "━━━━━━━━━━━━━━━\n"
-            response_text += "★ 입금시 '대표자명' 또는 '업체명'으로 입금 부탁드립니다.\n\n"
-            response_text += "★ 업체명으로 입금 진행시, [농업회사법인 주식회사]에서 잘리는 경우가 있습니다. "
-            response_text += "이와 같은 경우, 입금 확인이 늦어질 수 있으니 업체명을 식별할 수 있도록 표시 부탁드립니다."
-
-            return make_response(response_text, ["다른은행", "결제수단", "처음으로"])
-
-        # 다른은행 선택
-        if user_input == "다른은행":
-            return make_response(
-                "🏦 은행을 선택해주세요.",
-                ["기업은행", "우리은행", "농협은행", "처음으로"]
-            )
-
-        # 카드결제 선택
-        if user_input == "카드결제":
-            response_text = "💳 카드 결제 안내\n\n"
-            response_text += "1. 방문 결제\n"
-            response_text += "2. 토스 링크페이 결제\n"
-            response_text += "3. 홈페이지 통하여 검사 진행 후, 마이페이지 카드 결제\n\n"
-            response_text += "━━━━━━━━━━━━━━━\n"
-            response_text += "* 영수증이 필요하신 분은 결제 창에서 이메일을 작성하셔야 합니다."
-
-            return make_response(response_text, ["결제수단", "처음으로"])
-
-        # 통장사본 선택
-        if user_input == "통장사본":
-            response_text = "📄 통장 사본 안내\n\n"
-            response_text += "통장 사본은 [자료실-문서자료실] 18번 게시글을 통하여 다운로드 가능합니다.\n\n"
-            response_text += "🔗 홈페이지: www.biofl.co.kr"
-
-            return make_response(response_text, ["결제수단", "처음으로"])
-
-        # ===== 상담원 연결 =====
-        if user_input == "상담원 연결":
-            response_text = "👩‍💼 상담원 연결 안내\n\n"
-            response_text += "⏰ 상담 가능 시간\n"
-            response_text += "평일 09:00 ~ 17:00\n\n"
-            response_text += "━━━━━━━━━━━━━━━\n"
-            response_text += "아래 링크를 클릭하여 상담원과 연결하세요.\n\n"
-            response_text += "🔗 http://pf.kakao.com/_uCxnvxl/chat"
-
-            return make_response(response_text, ["처음으로"])
-
-        # Step 1: 기능 선택
-        if user_input in ["검사주기", "검사항목"]:
-            save_to_history(user_data)  # 히스토리 저장
-            user_data["기능"] = user_input
-            user_data.pop("분야", None)
-            user_data.pop("업종", None)
-            return make_response(
-                f"[{user_input}] 검사할 분야를 선택해주세요.",
-                ["식품", "축산", "이전", "처음으로"]
-            )
-
-        # Step 2: 분야 선택
-        if user_input in ["식품", "축산"]:
-            if "기능" not in user_data:
-                return make_response(
-                    "먼저 원하시는 서비스를 선택해주세요.",
-                    ["검사주기", "검사항목"]
-                )
-
-            save_to_history(user_data)  # 히스토리 저장
-            user_data["분야"] = user_input
-
-            # 식품유형 힌트 확인
-            food_hint = user_data.get("식품유형_힌트")
-
-            if user_data["기능"] == "검사주기":
-                # 검사주기: 업종 선택 필요
-                if user_input == "식품":
-                    buttons = ["식품제조가공업", "즉석판매제조가공업", "이전", "처음으로"]
-                else:
-                    buttons = ["축산물제조가공업", "축산물즉석판매제조가공업", "이전", "처음으로"]
-                return make_response(
-                    f"[{user_input}] 검사할 업종을 선택해주세요.",
-                    buttons
+            # OCR 캐시에 없으면 백그라운드에서 분석하고 IMAGE_SYNC_WAIT_SECONDS까지만 기다림
+            # (이미지 다운로드 + Vision API가 카카오 스킬 응답 제한 시간을 넘을 수 있음)
+            # 시간 안에 끝나면 바로 응답, 넘으면 콜백으로 먼저 응답하고 결과는 callbackUrl로 전송
+            callback_url = data.get("userRequest", {}).get("callbackUrl")
+            if callback_url and VISION_AVAILABLE and not has_cached_ocr_result(image_url):
+                future = _image_search_executor.submit(
+                    build_image_search_body, user_id, user_data, image_url
                 )
+                try:
+                    image_body = future.result(timeout=IMAGE_SYNC_WAIT_SECONDS)
+                except FutureTimeoutError:
+                    future.add_done_callback(partial(_send_image_search_callback, callback_url, user_id))
+                    return jsonify(IMAGE_CALLBACK_ACK_BODY)
             else:
-                # 검사항목: 바로 식품 유형 입력
-                msg = f"[{user_input}] 검사할 식품 유형을 입력해주세요.\n\n예: 과자, 음료, 소시지 등\n\n(주의 : 품목제조보고서에 표기된 \"식품유형\"을 입력하세요. 단어에 가운데 점이 있는 경우 제외하고 입력하세요)"
-                if food_hint:
-                    msg += f"\n\n💡 '{food_hint}'(으)로 검색하시려면 그대로 입력해주세요."
-                return make_response(msg, ["이전", "처음으로"])
-
-        # Step 3: 업종 선택 (검사주기만 해당)
-        if user_input in ["식품제조가공업", "즉석판매제조가공업", "축산물제조가공업", "축산물즉석판매제조가공업"]:
-            if user_data.get("기능") != "검사주기":
-                return make_response(
-                    "먼저 원하시는 서비스를 선택해주세요.",
-                    ["검사주기", "검사항목"]
-                )
+                image_body = build_image_search_body(user_id, user_data, image_url)
+            if image_body is not None:
+                return jsonify(image_body)
 
-            save_to_history(user_data)  # 히스토리 저장
-            user_data["업종"] = user_input
-
-            # 식품유형 힌트 확인
-            food_hint = user_data.get("식품유형_힌트")
-            hint_msg = f"\n\n💡 '{food_hint}'(으)로 검색하시려면 그대로 입력해주세요." if food_hint else ""
-
-            # 식품제조가공업, 축산물제조가공업은 품목제조보고서 주의 메시지
-            if user_input in ["식품제조가공업", "축산물제조가공업"]:
-                msg = f"[{user_input}] 검사할 식품 유형을 입력해주세요.\n\n예: 과자, 음료, 소시지 등\n\n(주의 : 품목제조보고서에 표기된 \"식품유형\"을 입력하세요. 단어에 가운데 점이 있는 경우 제외하고 입력하세요)"
-                return make_response(msg + hint_msg, ["이전", "처음으로"])
-            elif user_input == "즉석판매제조가공업":
-                # 즉석판매제조가공업은 영업신고증 주의 메시지 + 바로가기 버튼
-                message = f"[{user_input}] 검사할 식품 유형을 입력해주세요.\n\n"
-                message += "예: 과자, 음료, 소시지 등\n\n"
-                message += "(주의 : 영업신고증에 표기된 \"식품유형\"을 입력하세요. 단어에 가운데 점이 있는 경우 제외하고 입력하세요.)\n\n"
-                message += "* 주의 즉석판매제조가공업은 영업등록증에 표기된 식품의 유형만 자가품질검사 대상이 됩니다.\n\n"
-                message += "대상은 바로가기 버튼을 클릭하여 Q5. [즉석판매제조가공업] 자가품질검사 대상식품 및 검사주기를 참고해주세요."
-                message += hint_msg
-                return make_response_with_link(
-                    message,
-                    "바로가기",
-                    "https://www.biofl.co.kr/sub.jsp?code=7r9P7y94",
-                    ["이전", "처음으로"]
-                )
-            else:
-                # 축산물즉석판매제조가공업은 신고필증 주의 메시지 + 바로가기 버튼
-                message = f"[{user_input}] 검사할 식품 유형을 입력해주세요.\n\n"
-                message += "예: 과자, 음료, 소시지 등\n\n"
-                message += "(주의 : 신고필증에 표기된 \"식품유형\"을 입력하세요. 단어에 가운데 점이 있는 경우 제외하고 입력하세요.)\n\n"
-                message += "* 주의 축산물즉석판매제조가공업은 신고필증에 표기된 식품의 유형을 확인해주시고 바로가기 버튼을 클릭하여 \"Q5. [식육즉석판매가공업] 자가품질검사 대상식품 및 검사주기\"를 참고해 주세요."
-                message += hint_msg
-                return make_response_with_link(
-                    message,
-                    "바로가기",
-                    "https://www.biofl.co.kr/sub.jsp?code=XN0Cd4r7",
-                    ["이전", "처음으로"]
-                )
+        # ===== 결제수단 / 상담원 연결 (고정 명령어) =====
+        command_handler = STATIC_COMMAND_HANDLERS.get(user_input)
+        if command_handler:
+            return command_handler(user_data, user_input)
+
+        # ===== 검사주기/검사항목: 기능 → 분야 → 업종 선택 (Step 1~3) =====
+        step_handler = INSPECTION_STEP_HANDLERS.get(user_input)
+        if step_handler:
+            return step_handler(user_data, user_input)
 
         # Step 4: 식품 유형 입력 → 결과 조회
         if user_data.get("기능") and user_data.get("분야"):
@@ -5514,10 +5784,9 @@ FT-IR로 분석하여 Glycerol, Cellulose(섬유질) 등을 확인하여 식품
                     # 1개 매칭 시 바로 결과 표시
                     result = all_matches[0]
                     user_data["실패횟수"] = 0
-                    formatted_items = format_items_list(result['items'], user_data["분야"])
-                    response_text = f"✅ [{result['food_type']}]의 검사 항목:\n\n{formatted_items}"
-                    response_text += f"\n\n📌 다른 식품 유형을 입력하거나, [종료]를 눌러주세요."
-                    return make_response(response_text, ["종료"])
+                    return make_cached_response(render_inspection_item_result(
+                        user_data["분야"], result['food_type'], result['items']
+                    ))
                 else:
                     # 매칭 없음 - 실패 횟수 증가
                     user_data["실패횟수"] = user_data.get("실패횟수", 0) + 1
@@ -5565,11 +5834,9 @@ FT-IR로 분석하여 Glycerol, Cellulose(섬유질) 등을 확인하여 식품
                     # 1개 매칭 시 바로 결과 표시
                     result = all_matches[0]
                     user_data["실패횟수"] = 0
-                    formatted_cycle = format_korean_spacing(result['cycle'])
-                    formatted_food_type = format_korean_spacing(result['food_type'])
-                    response_text = f"✅ [{result['food_group']}] {formatted_food_type}의 검사주기:\n\n{formatted_cycle}"
-                    response_text += f"\n\n📌 다른 식품 유형을 입력하거나, [종료]를 눌러주세요."
-                    return make_response(response_text, ["종료"])
+                    return make_cached_response(render_inspection_cycle_result(
+                        result['food_group'], result['food_type'], result['cycle']
+                    ))
                 else:
                     # 매칭 없음 - 실패 횟수 증가
                     user_data["실패횟수"] = user_data.get("실패횟수", 0) + 1
@@ -5870,7 +6137,7 @@ FT-IR로 분석하여 Glycerol, Cellulose(섬유질) 등을 확인하여 식품
                 nlp_results = search_qa_by_query(user_input, top_n=15, min_score=2)  # 최대 15개 검색
 
                 if nlp_results:
-                    logger.info(f"[{user_id}] NLP 검색 결과: {len(nlp_results)}개")
+                    logger.info("[%s] NLP 검색 결과: %d개", user_id, len(nlp_results))
 
                     # NLP 모드 시작
                     user_data["nlp_모드"] = True
@@ -5913,14 +6180,18 @@ FT-IR로 분석하여 Glycerol, Cellulose(섬유질) 등을 확인하여 식품
         )
 
     except Exception as e:
-        logger.error(f"챗봇 오류: {e}")
+        logger.error("챗봇 오류: %s", e)
         return make_response(
             "❌ 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
             ["처음으로"]
         )
 
 
-if __name__ == '__main__':
+def prepare_app():
+    """서버 시작 전 준비 작업 (DB 초기화, 데이터 없을 시 초기 크롤링)
+
+    gunicorn --preload 실행 시 wsgi.py에서 마스터 프로세스가 한 번만 호출
+    """
     # 데이터베이스 초기화
     init_database()
 
@@ -5930,13 +6201,17 @@ if __name__ == '__main__':
         try:
             from crawler import run_crawler
             crawl_result = run_crawler()
-            logger.info(f"초기 크롤링 완료: {crawl_result}개 데이터 저장")
+            logger.info("초기 크롤링 완료: %s개 데이터 저장", crawl_result)
         except Exception as e:
-            logger.error(f"초기 크롤링 실패: {e}")
+            logger.error("초기 크롤링 실패: %s", e)
     else:
         logger.info("DB에 검사 데이터가 존재합니다.")
 
-    logger.info(f"서버 시작: http://{SERVER_HOST}:{SERVER_PORT}")
 
-    # 개발 서버 실행
-    app.run(host=SERVER_HOST, port=SERVER_PORT, debug=True)
+if __name__ == '__main__':
+    prepare_app()
+
+    logger.info("서버 시작: http://%s:%s", SERVER_HOST, SERVER_PORT)
+
+    # 개발용 서버 실행 (운영 환경은 wsgi.py + gunicorn 사용)
+    app.run(host=SERVER_HOST, port=SERVER_PORT)
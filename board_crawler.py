@@ -4,21 +4,25 @@
 - 자연어 처리를 위한 데이터 수집
 """
 import re
-import time
+import json
 import logging
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+import queue
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
 
-from config import LOG_FILE, LOG_FORMAT
-from models import save_board_mapping, init_database
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.etree
+import lxml.html
+
+from config import LOG_FILE, LOG_FORMAT, LOG_LEVEL
+from models import save_board_mappings_bulk, init_database
 
 # 로깅 설정
 logging.basicConfig(
-    level=logging.INFO,
+    level=LOG_LEVEL,
     format=LOG_FORMAT,
     handlers=[
         logging.FileHandler(LOG_FILE, encoding='utf-8'),
@@ -27,6 +31,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Selenium import (optional - 서버 HTML에 답변이 없는 질문만 브라우저로 처리)
+SELENIUM_AVAILABLE = False
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
+    SELENIUM_AVAILABLE = True
+except ImportError as e:
+    logger.warning("Selenium 모듈 로드 실패 (정적 HTML만 크롤링): %s", e)
+
 # 게시판 카테고리별 URL 및 question 번호 매핑
 BOARD_CONFIG = {
     "표시기준": {
@@ -121,12 +138,249 @@ BOARD_CONFIG = {
     }
 }
 
+# 크롤링 작업 목록: (카테고리, 기본 URL, question_id) - 모듈 로드 시 한 번만 펼침
+WORK_ITEMS = tuple(
+    (category, config["base_url"], question_id)
+    for category, config in BOARD_CONFIG.items()
+    for question_id in config["questions"]
+)
+QUESTION_COUNTS = Counter(category for category, _, _ in WORK_ITEMS)
+
+
+# 정적 HTML 요청 설정 (카테고리 페이지 동시 요청)
+STATIC_FETCH_TIMEOUT = 10
+STATIC_FETCH_WORKERS = 4
+
+# 화면 표시 기준 텍스트 추출 규칙 (WebElement.text와 같게 인라인 태그는 이어 붙이고
+# <br>/블록 요소에서만 줄바꿈, 표 셀은 공백으로 구분, script/style 내용은 제외)
+TEXT_BLOCK_TAGS = frozenset((
+    "address", "article", "aside", "blockquote", "caption", "dd", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5",
+    "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table",
+    "tbody", "tfoot", "thead", "tr", "ul",
+))
+TEXT_CELL_TAGS = frozenset(("td", "th"))
+TEXT_SKIP_TAGS = frozenset(("script", "style", "noscript", "template"))
+# 텍스트 노드의 연속 공백 (HTML 소스의 줄바꿈/들여쓰기는 화면에서 공백 1칸)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+# 줄 안의 연속 공백 (줄바꿈 제외)
+INLINE_WHITESPACE_PATTERN = re.compile(r"[^\S\n]+")
+
+# 브라우저에서 TEXT_* 규칙대로 화면 표시 텍스트를 만드는 함수 (_collect_rendered_text와 같은 동작)
+# innerText는 렌더링 상태(팝업 애니메이션, 숨김 처리)에 따라 결과가 달라지므로 DOM에서 줄바꿈을 직접 재구성
+RENDER_TEXT_SCRIPT = """
+var BLOCK_TAGS = %s;
+var CELL_TAGS = %s;
+var SKIP_TAGS = %s;
+function renderText(node) {
+    var parts = [];
+    (function walk(el) {
+        for (var child = el.firstChild; child; child = child.nextSibling) {
+            if (child.nodeType === 3) {
+                parts.push(child.nodeValue.replace(/\\s+/g, ' '));
+                continue;
+            }
+            if (child.nodeType !== 1) { continue; }
+            var tag = child.tagName.toLowerCase();
+            if (SKIP_TAGS[tag]) { continue; }
+            if (tag === 'br') { parts.push('\\n'); continue; }
+            var isBlock = BLOCK_TAGS[tag];
+            if (isBlock) { parts.push('\\n'); }
+            walk(child);
+            if (isBlock) { parts.push('\\n'); } else if (CELL_TAGS[tag]) { parts.push(' '); }
+        }
+    })(node);
+    return parts.join('');
+}
+""" % tuple(
+    json.dumps(dict.fromkeys(sorted(tags), 1))
+    for tags in (TEXT_BLOCK_TAGS, TEXT_CELL_TAGS, TEXT_SKIP_TAGS)
+)
+
+# Selenium에서 질문 제목/내용을 한 번의 스크립트 호출로 추출
+# 팝업 링크를 클릭해 답변을 불러온 뒤 answerWrap → answerLayer → 팝업 전체 순서로 표시 텍스트가 있는 요소 사용
+# 내용이 아직 렌더링되지 않았으면 MutationObserver로 DOM 변경을 감지해
+# 내용이 생기는 즉시 반환하고, 최대 대기 시간이 지나면 그때까지의 결과를 반환
+# 반환 전 팝업 닫기 버튼을 눌러 다음 질문 클릭에 영향이 없도록 함
+EXTRACT_QUESTION_SCRIPT = RENDER_TEXT_SCRIPT + """
+var questionId = arguments[0];
+var waitMs = arguments[1];
+var done = arguments[arguments.length - 1];
+function extract() {
+    var link = document.querySelector('a[data-needpopup-show="#' + questionId + '"]');
+    if (!link) { return null; }
+    var popup = document.getElementById(questionId);
+    var content = null;
+    if (popup) {
+        var candidates = [popup.querySelector('.answerWrap'), popup.querySelector('.answerLayer'), popup];
+        for (var i = 0; i < candidates.length; i++) {
+            var text = candidates[i] ? renderText(candidates[i]) : '';
+            if (text.trim()) {
+                content = text;
+                break;
+            }
+        }
+    }
+    return {title: renderText(link), content: content};
+}
+function finish(result) {
+    var closeButton = document.querySelector(
+        '#' + questionId + ' .close, #' + questionId + ' .btn-close, .needpopup-close'
+    );
+    if (closeButton) { closeButton.click(); }
+    done(result);
+}
+var popupLink = document.querySelector('a[data-needpopup-show="#' + questionId + '"]');
+if (!popupLink) { done(null); return; }
+popupLink.click();
+var result = extract();
+if (result.content) { finish(result); return; }
+var timer = null;
+var observer = new MutationObserver(function () {
+    var current = extract();
+    if (current && current.content) {
+        observer.disconnect();
+        clearTimeout(timer);
+        finish(current);
+    }
+});
+observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+timer = setTimeout(function () { observer.disconnect(); finish(extract()); }, waitMs);
+"""
+
+# 정적 HTML용 XPath (EXTRACT_QUESTION_SCRIPT와 같은 순서, cssselect 의존성 없이 lxml만 사용)
+STATIC_LINK_XPATH = lxml.etree.XPath("//a[@data-needpopup-show=$target]")
+STATIC_CONTENT_XPATHS = tuple(
+    lxml.etree.XPath(expr) for expr in (
+        "//*[@id=$qid]//*[contains(concat(' ', normalize-space(@class), ' '), ' answerWrap ')]",
+        "//*[@id=$qid]//*[contains(concat(' ', normalize-space(@class), ' '), ' answerLayer ')]",
+        "//*[@id=$qid]",
+    )
+)
+
+# Selenium 페이지 로드 대기 시간 (초)
+SELENIUM_WAIT_TIMEOUT = 10
+# 대기 조건 확인 간격 (초, 기본 0.5초는 요소가 생긴 뒤에도 최대 0.5초를 더 기다림)
+SELENIUM_POLL_INTERVAL = 0.1
+
+# 팝업 내용 렌더링 최대 대기 시간 (밀리초, 내용이 생기면 즉시 반환)
+ANSWER_WAIT_MS = 2500
+
+# Selenium이 필요한 카테고리를 동시에 처리할 WebDriver 수 (브라우저당 메모리 사용량 고려)
+SELENIUM_WORKERS = 2
+
+
+# 카테고리 페이지 요청용 세션 (keep-alive 연결 재사용 + 일시 오류 재시도)
+_http_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    # 429/5xx 응답은 지수 백오프로 재시도하고, Retry-After 헤더가 있으면 그 시간만큼 대기
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True
+    )
+)
+_http_session = requests.Session()
+_http_session.mount("https://", _http_adapter)
+_http_session.mount("http://", _http_adapter)
+
+
+def fetch_category_html(base_url: str) -> str:
+    """카테고리 페이지의 서버 렌더링 HTML 요청 (실패 시 None)"""
+    try:
+        response = _http_session.get(base_url, timeout=STATIC_FETCH_TIMEOUT)
+        response.raise_for_status()
+        # 서버가 charset을 지정하지 않은 경우에만 본문으로 추정 (추정은 느리고 한글 페이지에서 틀릴 수 있음)
+        if 'charset' not in response.headers.get('Content-Type', '').lower():
+            response.encoding = response.apparent_encoding or response.encoding
+        return response.text
+    except requests.RequestException as e:
+        logger.warning("정적 페이지 요청 실패 (%s): %s", base_url, e)
+        return None
+
+
+def _clean_text(text: str) -> str:
+    """추출한 텍스트의 줄별 공백 정리 (줄 안의 연속 공백은 1칸으로, 빈 줄 제거)"""
+    if not text:
+        return ""
+    lines = (INLINE_WHITESPACE_PATTERN.sub(" ", line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _collect_rendered_text(elem, parts: list):
+    """lxml 요소의 텍스트를 화면 표시 기준으로 parts에 추가 (TEXT_* 규칙)"""
+    tag = elem.tag
+    if not isinstance(tag, str) or tag in TEXT_SKIP_TAGS:
+        # 주석/처리 지시문, script/style 등은 내용 제외 (뒤따르는 tail은 부모에서 처리)
+        return
+    if tag == "br":
+        parts.append("\n")
+        return
+    is_block = tag in TEXT_BLOCK_TAGS
+    if is_block:
+        parts.append("\n")
+    if elem.text:
+        parts.append(WHITESPACE_PATTERN.sub(" ", elem.text))
+    for child in elem:
+        _collect_rendered_text(child, parts)
+        if child.tail:
+            parts.append(WHITESPACE_PATTERN.sub(" ", child.tail))
+    if is_block:
+        parts.append("\n")
+    elif tag in TEXT_CELL_TAGS:
+        parts.append(" ")
+
+
+def _element_text(elem) -> str:
+    """lxml 요소의 화면 표시 텍스트 (인라인 태그는 한 줄로, <br>/블록 요소에서 줄바꿈)"""
+    parts = []
+    _collect_rendered_text(elem, parts)
+    return _clean_text("".join(parts))
+
+
+def extract_static_question(tree, question_id: str) -> dict:
+    """정적 HTML 트리에서 질문 제목/내용 추출 (노드가 없으면 None)"""
+    popup_links = STATIC_LINK_XPATH(tree, target=f"#{question_id}")
+    if not popup_links:
+        return None
+
+    title = _element_text(popup_links[0])
+    content = None
+    for xpath in STATIC_CONTENT_XPATHS:
+        elems = xpath(tree, qid=question_id)
+        if elems:
+            text = _element_text(elems[0])
+            if text:
+                content = text
+                break
+
+    if not content:
+        # 내용이 JS로 채워지는 경우 Selenium으로 처리
+        return None
+    return {"title": title, "content": content}
+
+
+class BoardEntry(NamedTuple):
+    """크롤링한 게시판 질문 1건 (save_board_mappings_bulk의 행 형식과 동일한 튜플)"""
+    question_id: str
+    category: str
+    base_url: str
+    title: str
+    content: str
+
 
 class BoardCrawler:
     """게시판 크롤러 클래스"""
 
+    __slots__ = ("_driver", "_loaded_url", "_static_html", "_static_trees")
+
     def __init__(self):
         self._driver = None
+        self._loaded_url = None
+        self._static_html = {}
+        self._static_trees = {}
 
     def _get_driver(self):
         """Selenium WebDriver 생성"""
@@ -138,10 +392,25 @@ class BoardCrawler:
                 options.add_argument("--disable-dev-shm-usage")
                 options.add_argument("--disable-gpu")
                 options.add_argument("--window-size=1920,1080")
+                # 크롤링에 쓰지 않는 브라우저 부가 기능 비활성화 (시작 시간/백그라운드 네트워크 절감)
+                options.add_argument("--disable-extensions")
+                options.add_argument("--disable-default-apps")
+                options.add_argument("--disable-sync")
+                options.add_argument("--disable-background-networking")
+                options.add_argument("--disable-features=Translate,BackForwardCache,MediaRouter")
+                # 크롤링에 필요 없는 이미지 로드 생략, DOMContentLoaded 시점에 get() 반환
+                # (JS는 팝업 내용 렌더링에 필요하므로 유지, 필요한 요소는 WebDriverWait로 대기)
+                options.add_argument("--blink-settings=imagesEnabled=false")
+                options.add_experimental_option("prefs", {
+                    "profile.managed_default_content_settings.images": 2,
+                    "profile.default_content_setting_values.notifications": 2,
+                })
+                options.page_load_strategy = "eager"
                 self._driver = webdriver.Chrome(options=options)
+                self._driver.set_script_timeout(SELENIUM_WAIT_TIMEOUT)
                 logger.info("WebDriver 생성 완료")
             except Exception as e:
-                logger.error(f"WebDriver 생성 실패: {e}")
+                logger.error("WebDriver 생성 실패: %s", e)
                 raise
         return self._driver
 
@@ -150,13 +419,51 @@ class BoardCrawler:
         if self._driver:
             self._driver.quit()
             self._driver = None
+            self._loaded_url = None
             logger.info("WebDriver 종료")
 
+    def _get_static_tree(self, base_url: str):
+        """카테고리 페이지의 lxml 트리 반환 (실행당 URL별 1회만 요청/파싱)"""
+        if base_url not in self._static_trees:
+            if base_url in self._static_html:
+                html = self._static_html.pop(base_url)
+            else:
+                html = fetch_category_html(base_url)
+            self._static_trees[base_url] = lxml.html.fromstring(html) if html else None
+        return self._static_trees[base_url]
+
+    def _release_static_tree(self, base_url: str):
+        """카테고리 처리가 끝난 페이지의 HTML/트리 해제 (메모리에는 처리 중인 트리만 유지)"""
+        self._static_html.pop(base_url, None)
+        self._static_trees.pop(base_url, None)
+
+    def _prefetch_pages(self, base_urls):
+        """카테고리 페이지를 병렬로 미리 요청 (파싱은 카테고리를 처리할 때 한 번만)"""
+        pending = [
+            url for url in dict.fromkeys(base_urls)
+            if url not in self._static_trees and url not in self._static_html
+        ]
+        with ThreadPoolExecutor(max_workers=STATIC_FETCH_WORKERS) as executor:
+            for base_url, html in zip(pending, executor.map(fetch_category_html, pending)):
+                self._static_html[base_url] = html
+
+    def _load_page(self, base_url: str):
+        """카테고리 페이지 로드 (같은 페이지는 한 번만 로드하고 재사용)"""
+        driver = self._get_driver()
+        if self._loaded_url != base_url:
+            driver.get(base_url)
+            self._loaded_url = base_url
+            WebDriverWait(driver, SELENIUM_WAIT_TIMEOUT, poll_frequency=SELENIUM_POLL_INTERVAL).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "a[data-needpopup-show]"))
+            )
+        return driver
+
     def crawl_board_content(self, category: str, base_url: str, question_id: str) -> dict:
         """
-        특정 게시판 팝업에서 제목과 내용 추출
-        - answerPopOpen 링크를 클릭하여 팝업 내용 로드
-        - answerWrap에서 실제 Q&A 내용 추출
+        특정 게시판 팝업에서 제목과 내용 추출 (Selenium)
+        - 카테고리 페이지는 한 번만 로드하고 질문마다 DOM에서 바로 추출
+        - 팝업 링크를 클릭해 답변을 불러오고 answerWrap의 표시 텍스트를 DOM에서 재구성
+        - 질문당 WebDriver 명령은 execute_async_script 1회 (내용 렌더링 대기 포함)
 
         Args:
             category: 카테고리명
@@ -166,73 +473,114 @@ class BoardCrawler:
         Returns:
             {"title": 제목, "content": 내용} 또는 None
         """
-        driver = self._get_driver()
-
         try:
-            # 1. 기본 페이지 로드
-            driver.get(base_url)
-            time.sleep(1.5)
+            driver = self._load_page(base_url)
 
-            # 2. 해당 question의 팝업 링크 찾기 및 클릭
-            popup_link_selector = f'a[data-needpopup-show="#{question_id}"]'
-            try:
-                popup_link = driver.find_element(By.CSS_SELECTOR, popup_link_selector)
-
-                # 링크 텍스트가 질문 제목
-                link_text = popup_link.text.strip()
-
-                # 클릭하여 팝업 열기
-                driver.execute_script("arguments[0].click();", popup_link)
-                time.sleep(1)  # 팝업 로딩 대기
-
-            except NoSuchElementException:
-                logger.warning(f"⚠️ {category}/{question_id}: 팝업 링크 없음")
+            # 팝업 링크(링크 텍스트가 질문 제목)와 답변을 브라우저에서 한 번에 추출
+            # (답변이 늦게 렌더링되면 고정 sleep 없이 나타나는 즉시 반환)
+            extracted = driver.execute_async_script(EXTRACT_QUESTION_SCRIPT, question_id, ANSWER_WAIT_MS)
+            if not extracted:
+                logger.warning("⚠️ %s/%s: 팝업 링크 없음", category, question_id)
                 return None
 
-            # 3. 팝업 내용 추출
-            title = link_text  # 링크 텍스트가 제목
-            content = None
-
-            # answerWrap 내용 추출 시도
-            content_selectors = [
-                f"#{question_id} .answerWrap",
-                f"#{question_id} .answerLayer",
-                f"#{question_id}"
-            ]
-
-            for selector in content_selectors:
-                try:
-                    elem = driver.find_element(By.CSS_SELECTOR, selector)
-                    if elem and elem.text.strip():
-                        content = elem.text.strip()
-                        break
-                except NoSuchElementException:
-                    continue
-
-            # 4. 팝업 닫기 (다음 크롤링을 위해)
-            try:
-                close_btn = driver.find_element(By.CSS_SELECTOR, f"#{question_id} .close, #{question_id} .btn-close, .needpopup-close")
-                driver.execute_script("arguments[0].click();", close_btn)
-            except NoSuchElementException:
-                # ESC 키로 닫기 시도
-                from selenium.webdriver.common.keys import Keys
-                driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
-            time.sleep(0.3)
+            title = _clean_text(extracted.get("title"))
+            content = _clean_text(extracted.get("content")) or None
 
             if title or content:
-                logger.info(f"✅ {category}/{question_id}: {title[:30] if title else 'N/A'}...")
+                logger.info("✅ %s/%s: %.30s...", category, question_id, title or "N/A")
                 return {"title": title, "content": content}
             else:
-                logger.warning(f"⚠️ {category}/{question_id}: 내용 추출 실패")
+                logger.warning("⚠️ %s/%s: 내용 추출 실패", category, question_id)
                 return None
 
         except TimeoutException:
-            logger.error(f"❌ {category}/{question_id}: 타임아웃")
+            logger.error("❌ %s/%s: 타임아웃", category, question_id)
             return None
         except Exception as e:
-            logger.error(f"❌ {category}/{question_id}: {e}")
+            logger.error("❌ %s/%s: %s", category, question_id, e)
             return None
 
+    def _crawl_static_item(self, category: str, base_url: str, question_id: str) -> BoardEntry:
+        """
+        서버 HTML에 답변이 포함된 질문을 캐시된 페이지 트리에서 추출
+
+        Returns:
+            저장할 BoardEntry 또는 None (Selenium 처리 필요)
+        """
+        tree = self._get_static_tree(base_url)
+        result = extract_static_question(tree, question_id) if tree is not None else None
+        if not result:
+            return None
+        logger.info("✅ %s/%s: %.30s...", category, question_id, result["title"] or "N/A")
+        return BoardEntry(question_id, category, base_url, result["title"], result["content"])
+
+    def _crawl_selenium_items(self, items) -> list:
+        """같은 페이지의 질문들을 이 크롤러의 WebDriver로 추출"""
+        entries = []
+        for category, base_url, question_id in items:
+            result = self.crawl_board_content(category, base_url, question_id)
+            if result:
+                entries.append(BoardEntry(
+                    question_id, category, base_url, result.get("title"), result.get("content")
+                ))
+        return entries
+
+    def _crawl_selenium_groups(self, groups: dict) -> list:
+        """
+        Selenium이 필요한 질문을 페이지별로 처리
+        - 페이지가 하나면 기존 WebDriver 사용
+        - 여러 개면 WebDriver 풀(SELENIUM_WORKERS개)로 페이지를 동시에 처리
+        """
+        if len(groups) <= 1:
+            return [entry for items in groups.values() for entry in self._crawl_selenium_items(items)]
+
+        pool = [BoardCrawler() for _ in range(min(SELENIUM_WORKERS, len(groups)))]
+        workers = queue.Queue()
+        for worker in pool:
+            workers.put(worker)
+
+        def crawl_group(items):
+            worker = workers.get()
+            try:
+                return worker._crawl_selenium_items(items)
+            finally:
+                workers.put(worker)
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(pool)) as executor:
+                results = list(executor.map(crawl_group, groups.values()))
+        finally:
+            for worker in pool:
+                worker.close()
+        return [entry for entries in results for entry in entries]
+
+    def _crawl_items(self, items) -> Counter:
+        """작업 목록 크롤링 후 한 트랜잭션으로 일괄 저장, 카테고리별 성공 수 반환
+
+        서버 HTML에서 먼저 추출하고 페이지의 마지막 질문을 처리하면 트리를 바로 해제,
+        서버 HTML에 없는 질문만 모아 Selenium으로 처리
+        """
+        items = list(items)
+        remaining = Counter(base_url for _, base_url, _ in items)
+        entries = []
+        selenium_groups = {}  # {base_url: [(category, base_url, question_id), ...]}
+        for item in items:
+            category, base_url, question_id = item
+            entry = self._crawl_static_item(category, base_url, question_id)
+            if entry:
+                entries.append(entry)
+            elif SELENIUM_AVAILABLE:
+                selenium_groups.setdefault(base_url, []).append(item)
+            else:
+                logger.warning("⚠️ %s/%s: 서버 HTML에 없음 (Selenium 미설치)", category, question_id)
+            remaining[base_url] -= 1
+            if not remaining[base_url]:
+                self._release_static_tree(base_url)
+
+        entries.extend(self._crawl_selenium_groups(selenium_groups))
+        save_board_mappings_bulk(entries)
+        return Counter(entry.category for entry in entries)
+
     def crawl_category(self, category: str) -> int:
         """
         특정 카테고리의 모든 게시판 크롤링
@@ -244,50 +592,34 @@ class BoardCrawler:
             성공한 항목 수
         """
         if category not in BOARD_CONFIG:
-            logger.error(f"알 수 없는 카테고리: {category}")
+            logger.error("알 수 없는 카테고리: %s", category)
             return 0
 
-        config = BOARD_CONFIG[category]
-        base_url = config["base_url"]
-        questions = config["questions"]
-
-        success_count = 0
-        for question_id in questions:
-            result = self.crawl_board_content(category, base_url, question_id)
+        success_count = self._crawl_items(
+            item for item in WORK_ITEMS if item[0] == category
+        )[category]
 
-            if result:
-                save_board_mapping(
-                    question_id=question_id,
-                    category=category,
-                    base_url=base_url,
-                    title=result.get("title"),
-                    content=result.get("content")
-                )
-                success_count += 1
-
-            time.sleep(0.5)  # 서버 부하 방지
-
-        logger.info(f"📊 {category}: {success_count}/{len(questions)} 완료")
+        logger.info("📊 %s: %d/%d 완료", category, success_count, QUESTION_COUNTS[category])
         return success_count
 
     def crawl_all(self) -> dict:
-        """모든 카테고리 크롤링"""
+        """모든 카테고리 크롤링 (카테고리 페이지는 동시에 요청)"""
         logger.info("=" * 50)
         logger.info("전체 게시판 크롤링 시작")
         logger.info("=" * 50)
 
-        results = {}
-        total_success = 0
-        total_count = 0
+        # I/O 대기 시간이 대부분이므로 카테고리 페이지를 병렬로 미리 요청
+        self._prefetch_pages(base_url for _, base_url, _ in WORK_ITEMS)
+
+        # 평탄화된 작업 목록을 순서대로 처리하고 카테고리별 성공 수 집계
+        success = self._crawl_items(WORK_ITEMS)
+        results = {category: success[category] for category in BOARD_CONFIG}
 
-        for category in BOARD_CONFIG:
-            count = self.crawl_category(category)
-            results[category] = count
-            total_success += count
-            total_count += len(BOARD_CONFIG[category]["questions"])
+        for category, count in results.items():
+            logger.info("📊 %s: %d/%d 완료", category, count, QUESTION_COUNTS[category])
 
         logger.info("=" * 50)
-        logger.info(f"전체 크롤링 완료: {total_success}/{total_count}")
+        logger.info("전체 크롤링 완료: %d/%d", sum(results.values()), len(WORK_ITEMS))
         logger.info("=" * 50)
 
         return results
@@ -305,8 +637,7 @@ def main():
         print("\n📊 크롤링 결과:")
         print("-" * 40)
         for category, count in results.items():
-            total = len(BOARD_CONFIG[category]["questions"])
-            print(f"  {category}: {count}/{total}")
+            print(f"  {category}: {count}/{QUESTION_COUNTS[category]}")
         print("-" * 40)
 
     finally:
@@ -189,10 +189,30 @@ CRAWL_MINUTE = 0
 # 로깅 설정
 LOG_FILE = os.path.join(LOG_DIR, "chatbot.log")
 LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()  # 운영 환경에서 WARNING 등으로 조정 가능
 
 # Google Vision API 설정
 GOOGLE_VISION_CREDENTIALS = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS", "")
 VISION_API_MONTHLY_LIMIT = 990  # 월별 API 호출 제한 (무료 1000건 중 여유분 제외)
+OCR_CACHE_TTL = 3600  # OCR 결과 캐시 유지 시간 (초)
+OCR_FAILURE_CACHE_TTL = 300  # 인식 실패 결과 캐시 유지 시간 (초, 메모리에만 보관)
+OCR_CACHE_MAXSIZE = 1024  # OCR 결과 캐시 최대 개수
+OCR_CACHE_DB_DAYS = 90  # DB에 저장한 OCR 결과 보관 기간 (일)
+IMAGE_DOWNLOAD_MAX_BYTES = 10 * 1024 * 1024  # 직접 다운로드할 이미지 최대 크기 (초과 시 Vision에 URL 전달)
+IMAGE_DOWNLOAD_TIMEOUT = (3, 5)  # 이미지 다운로드 (연결, 읽기) 제한 시간 (초, 시도별 상한)
+IMAGE_ANALYSIS_BUDGET = 4.5  # 이미지 분석 전체(다운로드 + Vision API) 제한 시간 (초, 카카오 스킬 응답 제한 5초)
+IMAGE_DOWNLOAD_BUDGET = 2.5  # 그중 이미지 다운로드(모든 시도 합계) 제한 시간 (초, 넘으면 Vision에 URL 전달)
+VISION_API_TIMEOUT = 4  # Vision API 호출 제한 시간 상한 (초, 재시도 포함 / 실제로는 분석 제한 시간의 남은 시간 이내)
+IMAGE_CALLBACK_WORKERS = 4  # 콜백 방식 이미지 분석 동시 처리 수
+IMAGE_SYNC_WAIT_SECONDS = 3.5  # 이미지 분석을 기다렸다 바로 응답할 최대 시간 (초과 시 콜백으로 응답)
+KAKAO_CALLBACK_TIMEOUT = 5  # 카카오 콜백 URL 전송 제한 시간 (초)
+
+# 사용자 상태(메뉴 위치/히스토리) 보관 설정 - 오래 사용하지 않은 상태는 자동 삭제
+USER_STATE_TTL = 24 * 3600  # 마지막 사용 후 유지 시간 (초)
+USER_STATE_MAXSIZE = 10000  # 최대 보관 사용자 수 (초과 시 가장 오래 쓰지 않은 사용자부터 삭제)
+
+# 유사 식품유형 검색용 후보 캐시 유지 시간 (초) - 별도 프로세스 크롤링 반영 주기
+SIMILAR_CANDIDATES_TTL = 600
 
 # ===== 영양성분 표시대상 식품유형 데이터 =====
 # 카테고리별 식품유형 및 시행일 정보
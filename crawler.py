@@ -5,13 +5,10 @@
 """
 import re
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import logging
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import traceback
 
 from config import URL_MAPPING, INDUSTRY_MAPPING, ITEM_POPUP_MAPPING, NUTRITION_POPUP_MAPPING, GENERAL_POPUP_MAPPING, SECTION_FILTER, LOG_FILE, LOG_FORMAT
@@ -34,12 +31,87 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Selenium import (optional - 서버 HTML에 없는 팝업만 브라우저로 처리)
+SELENIUM_AVAILABLE = False
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    SELENIUM_AVAILABLE = True
+except ImportError as e:
+    logger.warning(f"Selenium 모듈 로드 실패 (정적 HTML만 크롤링): {e}")
+
+# 정적 페이지 요청 타임아웃 (초)
+STATIC_FETCH_TIMEOUT = 5
+
+# Selenium 대기 조건 확인 간격 (초, 기본 0.5초는 요소가 생긴 뒤에도 최대 0.5초를 더 기다림)
+SELENIUM_POLL_INTERVAL = 0.1
+
+# HTML 파서 (libxml2 기반 lxml) - 크롤링 대상인 answerPop 팝업 div만 트리로 생성
+HTML_PARSER = "lxml"
+POPUP_STRAINER = SoupStrainer("div", class_="needpopup answerPop")
+
+# 페이지 요청용 HTTP 세션 (keep-alive 연결 재사용 + 일시 오류 재시도)
+_http_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    # 429/5xx 응답은 지수 백오프로 재시도하고, Retry-After 헤더가 있으면 그 시간만큼 대기
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True
+    )
+)
+_http_session = requests.Session()
+_http_session.mount("https://", _http_adapter)
+_http_session.mount("http://", _http_adapter)
+_http_session.headers["Accept-Encoding"] = "gzip, deflate"
+
+
+def fetch_static_html(url: str) -> str:
+    """서버 렌더링 HTML 요청 (실패 시 None)"""
+    try:
+        response = _http_session.get(url, timeout=STATIC_FETCH_TIMEOUT)
+        response.raise_for_status()
+        # 서버가 charset을 지정하지 않은 경우에만 본문으로 추정 (추정은 느리고 한글 페이지에서 틀릴 수 있음)
+        if 'charset' not in response.headers.get('Content-Type', '').lower():
+            response.encoding = response.apparent_encoding or response.encoding
+        return response.text
+    except requests.RequestException as e:
+        logger.warning(f"정적 페이지 요청 실패 ({url}): {e}")
+        return None
+
+
+# 페이지 캐시 키에서 제외할 질문 파라미터 (같은 페이지의 다른 팝업을 가리킴)
+QUESTION_PARAM_PATTERN = re.compile(r"&question_\d+$")
+
+
+def _page_cache_key(url: str) -> str:
+    """팝업 지정 파라미터를 뺀 페이지 URL (같은 페이지 판별용)"""
+    return QUESTION_PARAM_PATTERN.sub("", url)
+
+
+def _parse_popups(html: str) -> BeautifulSoup:
+    """페이지 HTML에서 answerPop 팝업 부분만 파싱"""
+    return BeautifulSoup(html, HTML_PARSER, parse_only=POPUP_STRAINER)
+
+
+def _find_popup(soup: BeautifulSoup, target_id: str):
+    """answerPop 팝업 요소 찾기"""
+    return soup.find("div", class_="needpopup answerPop", id=target_id)
+
 
 class Crawler:
     """웹 크롤러 클래스"""
 
     def __init__(self):
         self._driver = None
+        # 크롤링 실행 중 파싱한 페이지 캐시 (같은 페이지 재요청/재파싱 방지)
+        self._static_pages = {}
+        self._rendered_pages = {}
 
     def _get_driver(self):
         """Selenium WebDriver 생성 (필요할 때만)"""
@@ -51,6 +123,20 @@ class Crawler:
                 options.add_argument("--disable-dev-shm-usage")
                 options.add_argument("--disable-gpu")
                 options.add_argument("--window-size=1920,1080")
+                # 크롤링에 쓰지 않는 브라우저 부가 기능 비활성화 (시작 시간/백그라운드 네트워크 절감)
+                options.add_argument("--disable-extensions")
+                options.add_argument("--disable-default-apps")
+                options.add_argument("--disable-sync")
+                options.add_argument("--disable-background-networking")
+                options.add_argument("--disable-features=Translate,BackForwardCache,MediaRouter")
+                # 크롤링에 필요 없는 이미지 로드 생략, DOMContentLoaded 시점에 get() 반환
+                # (JS는 팝업 내용 렌더링에 필요하므로 유지, 필요한 요소는 WebDriverWait로 대기)
+                options.add_argument("--blink-settings=imagesEnabled=false")
+                options.add_experimental_option("prefs", {
+                    "profile.managed_default_content_settings.images": 2,
+                    "profile.default_content_setting_values.notifications": 2,
+                })
+                options.page_load_strategy = "eager"
                 self._driver = webdriver.Chrome(options=options)
                 logger.info("WebDriver 생성 완료")
             except Exception as e:
@@ -64,6 +150,48 @@ class Crawler:
             self._driver.quit()
             self._driver = None
             logger.info("WebDriver 종료")
+        self._static_pages.clear()
+        self._rendered_pages.clear()
+
+    def _get_page_soup(self, url: str, target_id: str, require_table: bool = True) -> BeautifulSoup:
+        """대상 팝업이 들어있는 페이지의 BeautifulSoup 반환
+
+        - 같은 페이지는 크롤링 실행당 한 번만 요청/파싱
+        - 서버 HTML에 팝업이 있으면 requests 결과 사용, 없을 때만 Selenium으로 로드
+        """
+        page_key = _page_cache_key(url)
+
+        if page_key not in self._static_pages:
+            html = fetch_static_html(url)
+            self._static_pages[page_key] = _parse_popups(html) if html else None
+
+        soup = self._static_pages[page_key]
+        if soup is not None:
+            target_element = _find_popup(soup, target_id)
+            if target_element is not None and (target_element.find("table") or
+                                               (not require_table and target_element.get_text(strip=True))):
+                return soup
+
+        if not SELENIUM_AVAILABLE:
+            logger.warning(f"서버 HTML에 팝업 없음, Selenium 미설치로 건너뜀: {target_id} ({url})")
+            return soup if soup is not None else _parse_popups("")
+
+        if page_key not in self._rendered_pages:
+            driver = self._get_driver()
+            driver.get(url)
+            # 팝업 요소가 로드될 때까지 대기
+            try:
+                WebDriverWait(driver, 15, poll_frequency=SELENIUM_POLL_INTERVAL).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, f"div.needpopup.answerPop#{target_id}"))
+                )
+            except Exception:
+                # 팝업 요소 대기 실패 시 body 대기로 폴백
+                WebDriverWait(driver, 10, poll_frequency=SELENIUM_POLL_INTERVAL).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                )
+            self._rendered_pages[page_key] = _parse_popups(driver.page_source)
+
+        return self._rendered_pages[page_key]
 
     def _parse_table_with_rowspan(self, table):
         """rowspan 속성을 처리하여 HTML 테이블을 파싱
@@ -142,25 +270,12 @@ class Crawler:
             return 0
 
         try:
-            driver = self._get_driver()
             logger.info(f"검사항목 크롤링 시작: {category} (팝업 ID: {target_id})")
 
-            driver.get(url)
-            # 팝업 요소가 로드될 때까지 대기
-            try:
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, f"div.needpopup.answerPop#{target_id}"))
-                )
-            except Exception:
-                # 팝업 요소 대기 실패 시 body 대기로 폴백
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-
-            soup = BeautifulSoup(driver.page_source, "html.parser")
+            soup = self._get_page_soup(url, target_id)
 
             # 팝업 요소에서 테이블 찾기
-            target_element = soup.find("div", class_="needpopup answerPop", id=target_id)
+            target_element = _find_popup(soup, target_id)
             if not target_element:
                 logger.warning(f"검사항목 팝업 요소를 찾을 수 없음: {category} (ID: {target_id})")
                 return 0
@@ -213,29 +328,18 @@ class Crawler:
         total_count = 0
 
         try:
-            driver = self._get_driver()
             logger.info(f"검사주기 크롤링 시작: {category}")
 
-            driver.get(url)
-            # 첫 번째 업종의 팝업 요소가 로드될 때까지 대기
+            # 첫 번째 업종의 팝업 기준으로 페이지 로드
             first_target_id = INDUSTRY_MAPPING.get(industries[0])
-            try:
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, f"div.needpopup.answerPop#{first_target_id}"))
-                )
-            except Exception:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-
-            soup = BeautifulSoup(driver.page_source, "html.parser")
+            soup = self._get_page_soup(url, first_target_id)
 
             for industry in industries:
                 target_id = INDUSTRY_MAPPING.get(industry)
                 if not target_id:
                     continue
 
-                target_element = soup.find("div", class_="needpopup answerPop", id=target_id)
+                target_element = _find_popup(soup, target_id)
                 if not target_element:
                     logger.warning(f"검사주기 요소를 찾을 수 없음: {industry}")
                     continue
@@ -278,7 +382,6 @@ class Crawler:
         total_count = 0
 
         try:
-            driver = self._get_driver()
             logger.info("영양성분검사 정보 크롤링 시작")
 
             for test_type, url in URL_MAPPING.get("영양성분검사", {}).items():
@@ -289,15 +392,10 @@ class Crawler:
 
                 logger.info(f"영양성분검사 크롤링: {test_type} (URL: {url})")
 
-                driver.get(url)
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-
-                soup = BeautifulSoup(driver.page_source, "html.parser")
+                soup = self._get_page_soup(url, target_id)
 
                 # 팝업 요소에서 테이블 찾기
-                target_element = soup.find("div", class_="needpopup answerPop", id=target_id)
+                target_element = _find_popup(soup, target_id)
                 if not target_element:
                     logger.warning(f"영양성분검사 팝업 요소를 찾을 수 없음: {test_type} (ID: {target_id})")
                     continue
@@ -926,7 +1024,6 @@ class Crawler:
         ]
 
         try:
-            driver = self._get_driver()
             logger.info("일반 검사 정보 크롤링 시작")
 
             for category in categories:
@@ -945,15 +1042,11 @@ class Crawler:
 
                     logger.info(f"{category} 크롤링: {menu_type} (URL: {url})" + (f" [필터: {section_filter}]" if section_filter else ""))
 
-                    driver.get(url)
-                    WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
-
-                    soup = BeautifulSoup(driver.page_source, "html.parser")
+                    # 테이블 없이 텍스트만 있는 팝업도 있으므로 테이블 필수 아님
+                    soup = self._get_page_soup(url, target_id, require_table=False)
 
                     # 팝업 요소에서 테이블 찾기
-                    target_element = soup.find("div", class_="needpopup answerPop", id=target_id)
+                    target_element = _find_popup(soup, target_id)
                     if not target_element:
                         logger.warning(f"{category} 팝업 요소를 찾을 수 없음: {menu_type} (ID: {target_id})")
                         continue
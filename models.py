@@ -4,12 +4,17 @@
 - Q&A 질문-답변 저장 (신규)
 - 미답변 질문 로깅 (신규)
 """
+import heapq
 import re
 import sqlite3
 import math
+import threading
+import time
 from datetime import datetime
-from rapidfuzz import fuzz
-from config import DATABASE_PATH, VISION_API_MONTHLY_LIMIT
+from functools import lru_cache
+from typing import NamedTuple
+from rapidfuzz import fuzz, process
+from config import DATABASE_PATH, VISION_API_MONTHLY_LIMIT, SIMILAR_CANDIDATES_TTL
 
 # 유니코드 가운데점 변형 문자 패턴 (·, ･, ∙, •, ‧, ⋅ 등)
 MIDDLE_DOT_PATTERN = re.compile(r'[\u00B7\uFF65\u2219\u2022\u2027\u22C5\u2981\u30FB]')
@@ -81,6 +86,17 @@ def init_database():
         )
     """)
 
+    # OCR 결과 캐시 테이블 (같은 이미지 재업로드 시 Vision API 호출 절감, 재시작 후에도 유지)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS ocr_cache (
+            cache_key TEXT PRIMARY KEY,
+            success INTEGER NOT NULL,
+            food_type TEXT,
+            message TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
     # 영양성분검사 정보 테이블
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS nutrition_info (
@@ -712,106 +728,224 @@ def save_inspection_item(category: str, food_type: str, items: str):
 
     conn.commit()
     conn.close()
+    _invalidate_similar_candidates()
 
 
-def get_inspection_item(category: str, food_type: str) -> dict:
-    """검사항목 조회 (우선순위: 정확일치 > 끝나는일치 > 포함일치)"""
-    conn = get_connection()
-    cursor = conn.cursor()
+class FoodTypeIndex(NamedTuple):
+    """카테고리(/업종)별 식품유형 정규화 인덱스
+
+    entries: [(띄어쓰기제거값, SQL정규화값, 전체정규화값, 행), ...] (id 순)
+    by_space_key / by_sql_key: 정규화값 → 처음 나온 행 (정확 일치 O(1) 조회)
+    space_suffix / sql_suffix: 정규화값의 마지막 글자 → entries 목록 (끝나는 일치 후보, id 순)
+    """
+    entries: list
+    by_space_key: dict
+    by_sql_key: dict
+    space_suffix: dict
+    sql_suffix: dict
+
 
+def _like_suffix_char(char: str) -> str:
+    """LIKE 비교용 글자 (SQLite LIKE처럼 ASCII만 대소문자 무시)"""
+    return char.lower() if char.isascii() else char
+
+
+def _endswith_candidates(entries: list, suffix_index: dict, search_key: str):
+    """LIKE '%검색어' 후보 (마지막 글자가 같은 항목만, 와일드카드로 끝나면 전체)"""
+    if not search_key or search_key[-1] in "%_":
+        return entries
+    return suffix_index.get(_like_suffix_char(search_key[-1]), ())
+
+
+# 식품유형 검색 캐시 (SIMILAR_CANDIDATES_TTL 동안 유지, 검사항목/검사주기 저장 시 비움)
+# 유사 검색 후보 캐시: {키: (생성시각, [(식품유형, 정규화값, 글자집합), ...])}
+# 식품유형 정규화 인덱스 캐시: {키: (생성시각, FoodTypeIndex)}
+_similar_candidates_cache = {}
+_food_type_index_cache = {}
+_similar_candidates_lock = threading.Lock()
+
+
+def _invalidate_similar_candidates():
+    """유사 검색 후보·식품유형 인덱스 캐시 비우기 (검사항목/검사주기 저장 시 호출)"""
+    with _similar_candidates_lock:
+        _similar_candidates_cache.clear()
+        _food_type_index_cache.clear()
+
+
+def clear_food_type_caches():
+    """식품유형 검색 캐시 수동 초기화 (다른 프로세스에서 크롤링한 데이터를 TTL 전에 바로 반영)"""
+    _invalidate_similar_candidates()
+
+
+def _ttl_cached(cache: dict, key: tuple, build):
+    """cache에 SIMILAR_CANDIDATES_TTL 이내 값이 있으면 반환, 없으면 build()로 만들어 저장
+
+    build()는 잠금 밖에서 실행 (동시에 두 번 만들어져도 결과가 같으므로 무해)
+    """
+    now = time.monotonic()
+    with _similar_candidates_lock:
+        entry = cache.get(key)
+    if entry and now - entry[0] < SIMILAR_CANDIDATES_TTL:
+        return entry[1]
+
+    value = build()
+    with _similar_candidates_lock:
+        cache[key] = (now, value)
+    return value
+
+
+def _sql_normalize_food_type(food_type: str) -> str:
+    """기존 SQL REPLACE와 같은 정규화 (띄어쓰기, ·, ･ 제거)"""
+    return food_type.replace(" ", "").replace("·", "").replace("･", "")
+
+
+@lru_cache(maxsize=256)
+def _compile_like_pattern(pattern: str):
+    """SQLite LIKE 패턴을 정규식으로 변환 (%, _ 와일드카드, ASCII만 대소문자 무시)"""
+    parts = []
+    for char in pattern:
+        if char == "%":
+            parts.append(".*")
+        elif char == "_":
+            parts.append(".")
+        else:
+            parts.append(re.escape(char))
+    return re.compile("".join(parts), re.IGNORECASE | re.ASCII | re.DOTALL)
+
+
+def _get_food_type_index(cache_key: tuple, loader) -> FoodTypeIndex:
+    """행마다 정규화 결과를 미리 계산한 식품유형 인덱스를 캐시에서 반환"""
+    return _ttl_cached(_food_type_index_cache, cache_key, lambda: _build_food_type_index(loader))
+
+
+def _build_food_type_index(loader) -> FoodTypeIndex:
+    """loader()의 행으로 식품유형 정규화 인덱스 생성"""
+    index = FoodTypeIndex([], {}, {}, {}, {})
+    for row in loader():
+        row = dict(row)
+        food_type = row['food_type']
+        space_key = food_type.replace(" ", "")
+        sql_key = _sql_normalize_food_type(food_type)
+        entry = (space_key, sql_key, normalize_middle_dots(space_key), row)
+        index.entries.append(entry)
+        index.by_space_key.setdefault(space_key, row)
+        index.by_sql_key.setdefault(sql_key, row)
+        if space_key:
+            index.space_suffix.setdefault(_like_suffix_char(space_key[-1]), []).append(entry)
+        if sql_key:
+            index.sql_suffix.setdefault(_like_suffix_char(sql_key[-1]), []).append(entry)
+    return index
+
+
+def _exclude_startswith_rows(entries, search_key: str) -> list:
+    """검색어로 시작하는 행 제외 (정확 일치는 유지)"""
+    filtered = []
+    for _, _, normalized, row in entries:
+        if not normalized.startswith(search_key) or normalized == search_key:
+            filtered.append(dict(row))
+    return filtered
+
+
+def _match_normalized_rows(entries, search_key: str) -> list:
+    """정규화한 식품유형으로 매칭 (정확일치 1개 > 끝나는일치 > 포함일치)
+
+    정확 일치를 찾으면 나머지 행은 보지 않음
+    """
+    endswith = []
+    contains = []
+    for _, _, normalized, row in entries:
+        if normalized == search_key:
+            return [dict(row)]
+        if search_key in normalized:
+            item = dict(row)
+            contains.append(item)
+            # 검색어로 시작하는 항목 제외 (예: "햄버거류"는 "햄"으로 시작하므로 제외)
+            if normalized.endswith(search_key) and not normalized.startswith(search_key):
+                endswith.append(item)
+    return endswith or contains
+
+
+def _match_food_type_index_first(index: FoodTypeIndex, food_type: str) -> dict:
+    """미리 계산한 인덱스로 단일 결과 매칭 (띄어쓰기만 무시, 정확일치 > 끝나는일치)
+
+    결과는 기존 SQL 조회(REPLACE(food_type, ' ', '') + LIKE, id 순 스캔)와 동일
+    """
     # 띄어쓰기 제거한 검색어
     search_key = food_type.replace(" ", "")
 
     # 1. 정확히 일치하는 경우
-    cursor.execute("""
-        SELECT * FROM inspection_items
-        WHERE category = ? AND REPLACE(food_type, ' ', '') = ?
-    """, (category, search_key))
-    result = cursor.fetchone()
-    if result:
-        conn.close()
-        return dict(result)
+    row = index.by_space_key.get(search_key)
+    if row is not None:
+        return dict(row)
 
     # 2. 검색어로 끝나는 경우 (예: "햄" → "생햄", "프레스햄")
-    cursor.execute("""
-        SELECT * FROM inspection_items
-        WHERE category = ? AND REPLACE(food_type, ' ', '') LIKE ?
-    """, (category, f"%{search_key}"))
-    results = cursor.fetchall()
-
     # 검색어로 시작하는 항목 제외 (예: "햄버거류"는 "햄"으로 시작하므로 제외)
-    filtered = [r for r in results if not dict(r)['food_type'].replace(" ", "").startswith(search_key) or dict(r)['food_type'].replace(" ", "") == search_key]
+    endswith_pattern = _compile_like_pattern(f"%{search_key}")
+    for space_key, _, _, row in _endswith_candidates(index.entries, index.space_suffix, search_key):
+        if endswith_pattern.fullmatch(space_key) and (
+                not space_key.startswith(search_key) or space_key == search_key):
+            return dict(row)
 
-    if filtered:
-        conn.close()
-        return dict(filtered[0])
-
-    conn.close()
     return None
 
 
-def get_inspection_item_all_matches(category: str, food_type: str) -> list:
-    """검사항목 조회 - 모든 매칭 결과 반환 (정확일치 > 끝나는일치 > 포함일치)"""
-    conn = get_connection()
-    cursor = conn.cursor()
+def _match_food_type_index(index: FoodTypeIndex, food_type: str) -> list:
+    """미리 계산한 인덱스로 매칭 (정확일치 > 끝나는일치 > 포함일치 > 가운데점 폴백)
 
+    단계별 결과와 순서는 기존 SQL 조회(REPLACE + LIKE, id 순 스캔)와 동일
+    """
     # 띄어쓰기 및 모든 유니코드 가운데점 제거한 검색어
     search_key = normalize_middle_dots(food_type.replace(" ", ""))
 
     # 1. 정확히 일치하는 경우 (띄어쓰기, 가운데점 무시)
-    cursor.execute("""
-        SELECT * FROM inspection_items
-        WHERE category = ? AND REPLACE(REPLACE(REPLACE(food_type, ' ', ''), '·', ''), '･', '') = ?
-    """, (category, search_key))
-    result = cursor.fetchone()
-    if result:
-        conn.close()
-        return [dict(result)]  # 정확 일치는 1개만 반환
+    row = index.by_sql_key.get(search_key)
+    if row is not None:
+        return [dict(row)]  # 정확 일치는 1개만 반환
 
     # 2. 검색어로 끝나는 경우 (예: "음료" → "탄산음료", "과채음료")
-    cursor.execute("""
-        SELECT * FROM inspection_items
-        WHERE category = ? AND REPLACE(REPLACE(REPLACE(food_type, ' ', ''), '·', ''), '･', '') LIKE ?
-    """, (category, f"%{search_key}"))
-    results = cursor.fetchall()
-
-    # 검색어로 시작하는 항목 제외 (예: "햄버거류"는 "햄"으로 시작하므로 제외)
-    endswith_filtered = [dict(r) for r in results if not normalize_middle_dots(dict(r)['food_type'].replace(" ", "")).startswith(search_key) or normalize_middle_dots(dict(r)['food_type'].replace(" ", "")) == search_key]
-
+    endswith_pattern = _compile_like_pattern(f"%{search_key}")
+    endswith_filtered = _exclude_startswith_rows(
+        [
+            entry for entry in _endswith_candidates(index.entries, index.sql_suffix, search_key)
+            if endswith_pattern.fullmatch(entry[1])
+        ],
+        search_key
+    )
     if endswith_filtered:
-        conn.close()
         return endswith_filtered
 
     # 3. 검색어가 포함된 경우 (예: "탄산" → "탄산음료", "유산균" → "유산균음료")
-    cursor.execute("""
-        SELECT * FROM inspection_items
-        WHERE category = ? AND REPLACE(REPLACE(REPLACE(food_type, ' ', ''), '·', ''), '･', '') LIKE ?
-    """, (category, f"%{search_key}%"))
-    results = cursor.fetchall()
+    contains_pattern = _compile_like_pattern(f"%{search_key}%")
+    contains = [dict(row) for _, sql_key, _, row in index.entries if contains_pattern.fullmatch(sql_key)]
+    if contains:
+        return contains
+
+    # 4. 폴백: SQL 정규화가 처리하지 못한 유니코드 가운데점 변형 처리
+    return _match_normalized_rows(index.entries, search_key)
 
-    if results:
-        conn.close()
-        return [dict(r) for r in results]
 
-    # 4. Python 폴백: SQL REPLACE가 처리하지 못한 유니코드 가운데점 변형 처리
+def _load_item_rows(category: str) -> list:
+    """카테고리의 검사항목 전체 행 조회 (id 순)"""
+    conn = get_connection()
+    cursor = conn.cursor()
     cursor.execute("""
-        SELECT * FROM inspection_items WHERE category = ?
+        SELECT * FROM inspection_items WHERE category = ? ORDER BY id
     """, (category,))
-    all_rows = cursor.fetchall()
+    rows = cursor.fetchall()
     conn.close()
+    return rows
+
 
-    # Python에서 모든 가운데점 변형을 정규화하여 매칭
-    exact = [dict(r) for r in all_rows if normalize_middle_dots(dict(r)['food_type'].replace(" ", "")) == search_key]
-    if exact:
-        return exact[:1]
+def get_inspection_item(category: str, food_type: str) -> dict:
+    """검사항목 조회 (우선순위: 정확일치 > 끝나는일치 > 포함일치)"""
+    index = _get_food_type_index(("items", category), lambda: _load_item_rows(category))
+    return _match_food_type_index_first(index, food_type)
 
-    endswith = [dict(r) for r in all_rows if normalize_middle_dots(dict(r)['food_type'].replace(" ", "")).endswith(search_key)]
-    endswith_filtered2 = [r for r in endswith if not normalize_middle_dots(r['food_type'].replace(" ", "")).startswith(search_key) or normalize_middle_dots(r['food_type'].replace(" ", "")) == search_key]
-    if endswith_filtered2:
-        return endswith_filtered2
 
-    contains = [dict(r) for r in all_rows if search_key in normalize_middle_dots(dict(r)['food_type'].replace(" ", ""))]
-    return contains
+def get_inspection_item_all_matches(category: str, food_type: str) -> list:
+    """검사항목 조회 - 모든 매칭 결과 반환 (정확일치 > 끝나는일치 > 포함일치)"""
+    index = _get_food_type_index(("items", category), lambda: _load_item_rows(category))
+    return _match_food_type_index(index, food_type)
 
 
 def search_inspection_items(category: str, keyword: str) -> list:
@@ -862,106 +996,35 @@ def save_inspection_cycle(category: str, industry: str, food_group: str, food_ty
 
     conn.commit()
     conn.close()
+    _invalidate_similar_candidates()
 
 
-def get_inspection_cycle(category: str, industry: str, food_type: str) -> dict:
-    """검사주기 조회 (우선순위: 정확일치 > 끝나는일치 > 포함일치)"""
+def _load_cycle_rows(category: str, industry: str) -> list:
+    """카테고리/업종의 검사주기 전체 행 조회 (id 순)"""
     conn = get_connection()
     cursor = conn.cursor()
-
-    # 띄어쓰기 제거한 검색어
-    search_key = food_type.replace(" ", "")
-
-    # 1. 정확히 일치하는 경우
     cursor.execute("""
-        SELECT * FROM inspection_cycles
-        WHERE category = ? AND industry = ? AND REPLACE(food_type, ' ', '') = ?
-    """, (category, industry, search_key))
-    result = cursor.fetchone()
-    if result:
-        conn.close()
-        return dict(result)
-
-    # 2. 검색어로 끝나는 경우 (예: "햄" → "생햄", "프레스햄")
-    cursor.execute("""
-        SELECT * FROM inspection_cycles
-        WHERE category = ? AND industry = ? AND REPLACE(food_type, ' ', '') LIKE ?
-    """, (category, industry, f"%{search_key}"))
-    results = cursor.fetchall()
-
-    # 검색어로 시작하는 항목 제외 (예: "햄버거류"는 "햄"으로 시작하므로 제외)
-    filtered = [r for r in results if not dict(r)['food_type'].replace(" ", "").startswith(search_key) or dict(r)['food_type'].replace(" ", "") == search_key]
+        SELECT * FROM inspection_cycles WHERE category = ? AND industry = ? ORDER BY id
+    """, (category, industry))
+    rows = cursor.fetchall()
+    conn.close()
+    return rows
 
-    if filtered:
-        conn.close()
-        return dict(filtered[0])
 
-    conn.close()
-    return None
+def get_inspection_cycle(category: str, industry: str, food_type: str) -> dict:
+    """검사주기 조회 (우선순위: 정확일치 > 끝나는일치 > 포함일치)"""
+    index = _get_food_type_index(
+        ("cycles", category, industry), lambda: _load_cycle_rows(category, industry)
+    )
+    return _match_food_type_index_first(index, food_type)
 
 
 def get_inspection_cycle_all_matches(category: str, industry: str, food_type: str) -> list:
     """검사주기 조회 - 모든 매칭 결과 반환 (정확일치 > 끝나는일치 > 포함일치)"""
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    # 띄어쓰기 및 모든 유니코드 가운데점 제거한 검색어
-    search_key = normalize_middle_dots(food_type.replace(" ", ""))
-
-    # 1. 정확히 일치하는 경우 (띄어쓰기, 가운데점 무시)
-    cursor.execute("""
-        SELECT * FROM inspection_cycles
-        WHERE category = ? AND industry = ? AND REPLACE(REPLACE(REPLACE(food_type, ' ', ''), '·', ''), '･', '') = ?
-    """, (category, industry, search_key))
-    result = cursor.fetchone()
-    if result:
-        conn.close()
-        return [dict(result)]  # 정확 일치는 1개만 반환
-
-    # 2. 검색어로 끝나는 경우 (예: "음료" → "탄산음료", "과채음료")
-    cursor.execute("""
-        SELECT * FROM inspection_cycles
-        WHERE category = ? AND industry = ? AND REPLACE(REPLACE(REPLACE(food_type, ' ', ''), '·', ''), '･', '') LIKE ?
-    """, (category, industry, f"%{search_key}"))
-    results = cursor.fetchall()
-
-    # 검색어로 시작하는 항목 제외 (예: "햄버거류"는 "햄"으로 시작하므로 제외)
-    endswith_filtered = [dict(r) for r in results if not normalize_middle_dots(dict(r)['food_type'].replace(" ", "")).startswith(search_key) or normalize_middle_dots(dict(r)['food_type'].replace(" ", "")) == search_key]
-
-    if endswith_filtered:
-        conn.close()
-        return endswith_filtered
-
-    # 3. 검색어가 포함된 경우 (예: "탄산" → "탄산음료", "유산균" → "유산균음료")
-    cursor.execute("""
-        SELECT * FROM inspection_cycles
-        WHERE category = ? AND industry = ? AND REPLACE(REPLACE(REPLACE(food_type, ' ', ''), '·', ''), '･', '') LIKE ?
-    """, (category, industry, f"%{search_key}%"))
-    results = cursor.fetchall()
-
-    if results:
-        conn.close()
-        return [dict(r) for r in results]
-
-    # 4. Python 폴백: SQL REPLACE가 처리하지 못한 유니코드 가운데점 변형 처리
-    cursor.execute("""
-        SELECT * FROM inspection_cycles WHERE category = ? AND industry = ?
-    """, (category, industry))
-    all_rows = cursor.fetchall()
-    conn.close()
-
-    # Python에서 모든 가운데점 변형을 정규화하여 매칭
-    exact = [dict(r) for r in all_rows if normalize_middle_dots(dict(r)['food_type'].replace(" ", "")) == search_key]
-    if exact:
-        return exact[:1]
-
-    endswith = [dict(r) for r in all_rows if normalize_middle_dots(dict(r)['food_type'].replace(" ", "")).endswith(search_key)]
-    endswith_filtered2 = [r for r in endswith if not normalize_middle_dots(r['food_type'].replace(" ", "")).startswith(search_key) or normalize_middle_dots(r['food_type'].replace(" ", "")) == search_key]
-    if endswith_filtered2:
-        return endswith_filtered2
-
-    contains = [dict(r) for r in all_rows if search_key in normalize_middle_dots(dict(r)['food_type'].replace(" ", ""))]
-    return contains
+    index = _get_food_type_index(
+        ("cycles", category, industry), lambda: _load_cycle_rows(category, industry)
+    )
+    return _match_food_type_index(index, food_type)
 
 
 def search_inspection_cycles(category: str, industry: str, keyword: str) -> list:
@@ -1024,74 +1087,76 @@ def get_all_food_types_cycles(category: str, industry: str) -> list:
     return [row['food_type'] for row in results]
 
 
-def find_similar_items(category: str, keyword: str, min_score: int = 40) -> list:
-    """검사항목에서 유사한 식품 유형 찾기"""
-    all_types = get_all_food_types_items(category)
-    similar = []
+def _get_similar_candidates(cache_key: tuple, loader) -> list:
+    """식품 유형 목록을 정규화·글자집합까지 미리 계산해 캐시에서 반환"""
+    return _ttl_cached(_similar_candidates_cache, cache_key, lambda: _build_similar_candidates(loader))
 
-    # 띄어쓰기 및 가운데점(·) 제거
-    keyword_normalized = normalize_middle_dots(keyword.replace(" ", ""))
 
-    for food_type in all_types:
-        food_type_normalized = normalize_middle_dots(food_type.replace(" ", ""))
+def _build_similar_candidates(loader) -> list:
+    """loader()의 식품 유형마다 (식품유형, 정규화값, 글자집합) 생성"""
+    candidates = []
+    for food_type in loader():
+        normalized = normalize_middle_dots(food_type.replace(" ", ""))
+        candidates.append((food_type, normalized, frozenset(normalized)))
+    return candidates
 
-        # 정확히 일치하면 제외 (이미 메인 매칭에서 처리됨)
-        if food_type_normalized == keyword_normalized:
-            continue
-
-        # 검색어를 포함하는 경우 높은 점수 부여
-        if keyword_normalized in food_type_normalized or food_type_normalized in keyword_normalized:
-            similar.append((food_type, 95))
-            continue
 
-        # 공통 글자 수 체크
-        common_chars = set(keyword_normalized) & set(food_type_normalized)
-        if len(common_chars) >= 2:
-            if len(keyword_normalized) <= 2:
-                score = fuzz.ratio(keyword_normalized, food_type_normalized)
-            else:
-                score = fuzz.partial_ratio(keyword_normalized, food_type_normalized)
-            if score >= min_score:
-                similar.append((food_type, score))
-
-    # 점수순 정렬
-    similar.sort(key=lambda x: x[1], reverse=True)
-    return [item[0] for item in similar[:5]]
-
-
-def find_similar_cycles(category: str, industry: str, keyword: str, min_score: int = 40) -> list:
-    """검사주기에서 유사한 식품 유형 찾기"""
-    all_types = get_all_food_types_cycles(category, industry)
-    similar = []
+def _rank_similar_food_types(candidates: list, keyword: str, min_score: int) -> list:
+    """미리 계산된 후보에서 유사한 식품 유형 상위 5개 반환"""
+    similar = []  # (후보 순서, 식품유형, 점수)
+    fuzzy_targets = []  # 유사도 계산 대상 (후보 순서, 식품유형, 정규화값)
 
     # 띄어쓰기 및 가운데점(·) 제거
     keyword_normalized = normalize_middle_dots(keyword.replace(" ", ""))
+    keyword_chars = set(keyword_normalized)
 
-    for food_type in all_types:
-        food_type_normalized = normalize_middle_dots(food_type.replace(" ", ""))
-
+    for position, (food_type, food_type_normalized, food_type_chars) in enumerate(candidates):
         # 정확히 일치하면 제외 (이미 메인 매칭에서 처리됨)
         if food_type_normalized == keyword_normalized:
             continue
 
         # 검색어를 포함하는 경우 높은 점수 부여
         if keyword_normalized in food_type_normalized or food_type_normalized in keyword_normalized:
-            similar.append((food_type, 95))
+            similar.append((position, food_type, 95))
             continue
 
         # 공통 글자 수 체크
-        common_chars = set(keyword_normalized) & set(food_type_normalized)
-        if len(common_chars) >= 2:
-            if len(keyword_normalized) <= 2:
-                score = fuzz.ratio(keyword_normalized, food_type_normalized)
-            else:
-                score = fuzz.partial_ratio(keyword_normalized, food_type_normalized)
-            if score >= min_score:
-                similar.append((food_type, score))
+        if len(keyword_chars & food_type_chars) >= 2:
+            fuzzy_targets.append((position, food_type, food_type_normalized))
+
+    # 유사도는 rapidfuzz에서 한 번에 계산 (후보별 Python 호출 제거)
+    if fuzzy_targets:
+        scorer = fuzz.ratio if len(keyword_normalized) <= 2 else fuzz.partial_ratio
+        matches = process.extract(
+            keyword_normalized,
+            [target[2] for target in fuzzy_targets],
+            scorer=scorer,
+            score_cutoff=min_score,
+            limit=None
+        )
+        for _, score, index in matches:
+            position, food_type, _ = fuzzy_targets[index]
+            similar.append((position, food_type, score))
 
-    # 점수순 정렬
-    similar.sort(key=lambda x: x[1], reverse=True)
-    return [item[0] for item in similar[:5]]
+    # 점수순 상위 5개 (동점은 후보 순서 유지, 전체 정렬 없이 선택)
+    top = heapq.nsmallest(5, similar, key=lambda x: (-x[2], x[0]))
+    return [item[1] for item in top]
+
+
+def find_similar_items(category: str, keyword: str, min_score: int = 40) -> list:
+    """검사항목에서 유사한 식품 유형 찾기"""
+    candidates = _get_similar_candidates(
+        ("items", category), lambda: get_all_food_types_items(category)
+    )
+    return _rank_similar_food_types(candidates, keyword, min_score)
+
+
+def find_similar_cycles(category: str, industry: str, keyword: str, min_score: int = 40) -> list:
+    """검사주기에서 유사한 식품 유형 찾기"""
+    candidates = _get_similar_candidates(
+        ("cycles", category, industry), lambda: get_all_food_types_cycles(category, industry)
+    )
+    return _rank_similar_food_types(candidates, keyword, min_score)
 
 
 # ===== 영양성분검사 관련 함수 =====
@@ -1246,6 +1311,56 @@ def get_vision_api_remaining() -> int:
     return max(0, VISION_API_MONTHLY_LIMIT - current_usage)
 
 
+# ===== OCR 결과 캐시 =====
+
+def get_ocr_cache(cache_key: str, max_age_days: int) -> dict:
+    """저장된 OCR 결과 조회 (max_age_days 이내에 저장된 결과만)"""
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        SELECT success, food_type, message FROM ocr_cache
+        WHERE cache_key = ? AND created_at >= datetime('now', ?)
+    """, (cache_key, f"-{max_age_days} days"))
+
+    result = cursor.fetchone()
+    conn.close()
+
+    if not result:
+        return None
+    return {
+        'success': bool(result['success']),
+        'food_type': result['food_type'],
+        'message': result['message']
+    }
+
+
+def save_ocr_cache(cache_keys: list, result: dict, max_age_days: int):
+    """OCR 결과를 여러 키(URL, 이미지 해시)로 저장하고 보관 기간이 지난 결과 삭제"""
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.executemany("""
+        INSERT INTO ocr_cache (cache_key, success, food_type, message, created_at)
+        VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(cache_key) DO UPDATE SET
+            success = excluded.success,
+            food_type = excluded.food_type,
+            message = excluded.message,
+            created_at = excluded.created_at
+    """, [
+        (key, int(result['success']), result['food_type'], result['message'])
+        for key in cache_keys
+    ])
+
+    cursor.execute("""
+        DELETE FROM ocr_cache WHERE created_at < datetime('now', ?)
+    """, (f"-{max_age_days} days",))
+
+    conn.commit()
+    conn.close()
+
+
 # ===== 게시판 매핑 관련 함수 (자연어 처리용) =====
 
 def save_board_mapping(question_id: str, category: str, base_url: str,
@@ -1271,6 +1386,38 @@ def save_board_mapping(question_id: str, category: str, base_url: str,
     conn.close()
 
 
+def save_board_mappings_bulk(rows: list) -> int:
+    """게시판 매핑 일괄 저장 (한 트랜잭션, 커밋 1회)
+
+    save_board_mapping과 같은 규칙으로 저장 (키워드/동의어/의도/우선순위는 기본값)
+
+    Args:
+        rows: (question_id, category, base_url, title, content) 튜플 리스트
+
+    Returns:
+        저장한 행 수
+    """
+    if not rows:
+        return 0
+
+    now = datetime.now()
+    conn = get_connection()
+    with conn:
+        conn.executemany("""
+            INSERT INTO board_mappings (question_id, category, base_url, title, content,
+                                        keywords, synonyms, intent, priority, updated_at)
+            VALUES (?, ?, ?, ?, ?, NULL, NULL, NULL, 0, ?)
+            ON CONFLICT(question_id)
+            DO UPDATE SET category = excluded.category, base_url = excluded.base_url,
+                          title = excluded.title, content = excluded.content,
+                          keywords = excluded.keywords, synonyms = excluded.synonyms,
+                          intent = excluded.intent, priority = excluded.priority,
+                          updated_at = excluded.updated_at
+        """, [(*row, now) for row in rows])
+    conn.close()
+    return len(rows)
+
+
 def get_board_mapping(question_id: str) -> dict:
     """특정 게시판 매핑 조회"""
     conn = get_connection()
@@ -1528,40 +1675,40 @@ def search_qa_response(search_text: str, min_score: int = 60) -> dict:
 
     # 검색어 정규화
     search_normalized = search_text.replace(" ", "").lower()
-    best_match = None
-    best_score = 0
 
-    for qa in all_qa:
-        qa_dict = dict(qa)
-        question = qa_dict['question']
-        keywords = qa_dict['keywords'] or ""
-
-        # 질문 정규화
-        question_normalized = question.replace(" ", "").lower()
+    qa_list = [dict(qa) for qa in all_qa]
+    questions_normalized = [qa['question'].replace(" ", "").lower() for qa in qa_list]
 
-        # 1. 정확히 일치
+    # 1. 정확히 일치
+    for qa_dict, question_normalized in zip(qa_list, questions_normalized):
         if search_normalized == question_normalized:
             # 사용 횟수 증가
             increment_qa_usage(qa_dict['id'])
             return qa_dict
 
-        # 2. 키워드 포함 체크
+    # 2. 키워드 포함 체크 (키워드 매칭 높은 점수)
+    scores = []
+    for qa_dict in qa_list:
+        keywords = qa_dict['keywords'] or ""
         keyword_list = [k.strip().lower() for k in keywords.split(",") if k.strip()]
-        for kw in keyword_list:
-            if kw in search_normalized or search_normalized in kw:
-                score = 80  # 키워드 매칭 높은 점수
-                if score > best_score:
-                    best_score = score
-                    best_match = qa_dict
-
-        # 3. 유사도 계산
-        score = fuzz.partial_ratio(search_normalized, question_normalized)
-        if score > best_score:
-            best_score = score
-            best_match = qa_dict
-
-    # 최소 점수 이상인 경우만 반환
-    if best_match and best_score >= min_score:
+        matched = any(kw in search_normalized or search_normalized in kw for kw in keyword_list)
+        scores.append(80 if matched else 0)
+
+    # 3. 유사도 계산 (rapidfuzz에서 전체 질문을 한 번에 계산, 최소 점수 미만은 제외)
+    for _, score, index in process.extract(
+        search_normalized,
+        questions_normalized,
+        scorer=fuzz.partial_ratio,
+        score_cutoff=min_score,
+        limit=None
+    ):
+        scores[index] = max(scores[index], score)
+
+    # 최고 점수 항목 (동점이면 먼저 나온 항목), 최소 점수 이상인 경우만 반환
+    best_index = max(range(len(scores)), key=scores.__getitem__)
+    best_score = scores[best_index]
+    if best_score > 0 and best_score >= min_score:
+        best_match = qa_list[best_index]
         increment_qa_usage(best_match['id'])
         return best_match
 
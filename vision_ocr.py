@@ -2,26 +2,192 @@
 Google Vision API OCR
 - 이미지에서 식품유형 추출
 """
+import hashlib
 import logging
 import re
+import threading
+import time
+from collections import OrderedDict
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import unquote, urlparse
 
 # Google Vision API import (optional)
 VISION_IMPORT_SUCCESS = False
 vision = None
+google_exceptions = None
+google_retry = None
 try:
     from google.cloud import vision
+    from google.api_core import exceptions as google_exceptions
+    from google.api_core import retry as google_retry
     VISION_IMPORT_SUCCESS = True
 except BaseException as e:
     logging.warning(f"Google Vision API 모듈 로드 실패: {e}")
     vision = None
     VISION_IMPORT_SUCCESS = False
 
-from models import can_use_vision_api, increment_api_usage
+from config import (
+    OCR_CACHE_TTL, OCR_FAILURE_CACHE_TTL, OCR_CACHE_MAXSIZE, OCR_CACHE_DB_DAYS, IMAGE_DOWNLOAD_MAX_BYTES,
+    IMAGE_DOWNLOAD_TIMEOUT, IMAGE_DOWNLOAD_BUDGET, IMAGE_ANALYSIS_BUDGET, VISION_API_TIMEOUT
+)
+from models import (
+    can_use_vision_api, get_vision_api_remaining, increment_api_usage, get_ocr_cache, save_ocr_cache
+)
 
 logger = logging.getLogger(__name__)
 
+# OCR 텍스트의 식품유형 표기 패턴 (우선순위 순서, 앞 패턴에서 찾으면 뒤 패턴은 검사하지 않음)
+FOOD_TYPE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'식품유형\s*[:\s]*([^\n\r,]+)',
+    r'식품의\s*유형\s*[:\s]*([^\n\r,]+)',
+    r'식품의\s*종류\s*[:\s]*([^\n\r,]+)',
+    r'식품종류\s*[:\s]*([^\n\r,]+)',
+    r'품목유형\s*[:\s]*([^\n\r,]+)',
+    r'제품유형\s*[:\s]*([^\n\r,]+)',
+    r'유\s*형\s*[:\s]*([^\n\r,]+)',
+))
+# 추출한 식품유형에서 제거할 문자 (글자/숫자/공백 외)
+FOOD_TYPE_CLEANUP_PATTERN = re.compile(r'[^\w가-힣\s]')
+
+# Vision API 재시도 정책: 일시적 오류(503/500)만 짧은 지수 백오프로 재시도하고
+# 전체 소요 시간은 VISION_API_TIMEOUT 안으로 제한 (클라이언트 기본값은 최대 600초)
+# 호출 시에는 with_deadline으로 이미지 분석 제한 시간의 남은 시간까지 더 줄여서 사용
+VISION_RETRY = google_retry.Retry(
+    predicate=google_retry.if_exception_type(
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.InternalServerError
+    ),
+    initial=0.2,
+    maximum=1.0,
+    multiplier=2.0,
+    deadline=VISION_API_TIMEOUT
+) if VISION_IMPORT_SUCCESS else None
+
+# Vision 응답 필드 마스크: 전체 텍스트(description)와 오류만 받고 단어별 좌표(bounding_poly)는 제외
+# (응답 크기와 protobuf 파싱 비용 절감, 사용하는 필드는 text_annotations[].description 뿐)
+VISION_RESPONSE_METADATA = (
+    ("x-goog-fieldmask", "responses.text_annotations.description,responses.error"),
+)
+
+# 이미지 다운로드용 HTTP 세션 (keep-alive 연결 재사용으로 TLS 핸드셰이크 절감)
+_http_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    # 재시도는 download_image의 헤더 조합 반복이 IMAGE_DOWNLOAD_BUDGET 안에서 담당
+    # (어댑터 재시도는 전체 제한 시간을 모른 채 시간을 더 쓰므로 사용하지 않음)
+    max_retries=0
+)
+_http_session = requests.Session()
+_http_session.mount("https://", _http_adapter)
+_http_session.mount("http://", _http_adapter)
+
+# OCR 결과 캐시 (같은 이미지 재업로드 시 Vision API 호출/사용량 절감)
+# key: URL 또는 이미지 바이트의 blake2b 해시, value: (만료시각, 결과 dict)
+# 메모리에 없으면 DB(ocr_cache)에서 조회하므로 재시작 후에도 같은 이미지는 다시 호출하지 않음
+# 인식 실패 결과는 다른 사진으로 다시 시도하는 경우가 많으므로 짧게 메모리에만 보관
+_ocr_cache = OrderedDict()
+_ocr_cache_lock = threading.Lock()
+
+
+def _ocr_cache_key(data: bytes) -> str:
+    """캐시 키 생성 (blake2b 128bit)"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _get_cached_result(key: str) -> dict:
+    """캐시된 OCR 결과 조회 (메모리 → DB 순, 없으면 None)"""
+    with _ocr_cache_lock:
+        entry = _ocr_cache.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if time.monotonic() <= expires_at:
+                _ocr_cache.move_to_end(key)
+                return dict(result)
+            del _ocr_cache[key]
+
+    try:
+        result = get_ocr_cache(key, OCR_CACHE_DB_DAYS)
+    except Exception as e:
+        logger.warning(f"OCR 캐시 DB 조회 실패: {e}")
+        return None
+    if result is None or not result.get('success'):
+        return None
+    _remember_result([key], result)
+    return dict(result)
+
+
+def _remember_result(keys: list, result: dict, ttl: float = OCR_CACHE_TTL):
+    """OCR 결과를 메모리 캐시에 저장 (최대 개수 초과 시 오래된 항목부터 제거)"""
+    expires_at = time.monotonic() + ttl
+    with _ocr_cache_lock:
+        for key in keys:
+            _ocr_cache[key] = (expires_at, dict(result))
+            _ocr_cache.move_to_end(key)
+        while len(_ocr_cache) > OCR_CACHE_MAXSIZE:
+            _ocr_cache.popitem(last=False)
+
+
+def _cache_result(keys: list, result: dict) -> dict:
+    """OCR 결과를 여러 키(URL, 이미지 해시)로 메모리와 DB에 캐시하고 결과 반환
+
+    인식 실패 결과는 OCR_FAILURE_CACHE_TTL 동안 메모리에만 보관 (DB에는 성공 결과만 저장)
+    """
+    if not result.get('success'):
+        _remember_result(keys, result, OCR_FAILURE_CACHE_TTL)
+        return result
+    _remember_result(keys, result)
+    try:
+        save_ocr_cache(keys, result, OCR_CACHE_DB_DAYS)
+    except Exception as e:
+        # 캐시 저장 실패가 사용자 응답을 막지 않도록 기록만 남김
+        logger.warning(f"OCR 캐시 DB 저장 실패: {e}")
+    return result
+
+
+# Vision API 클라이언트 (gRPC 채널/인증을 요청마다 새로 만들지 않도록 프로세스당 1개 재사용)
+_vision_client = None
+
+
+def _init_grpc_gevent():
+    """gevent monkey patch된 프로세스면 gRPC I/O를 gevent 방식으로 전환 (모듈 로드 시 1회)
+
+    전환하지 않으면 Vision API 호출(gRPC)이 응답을 기다리는 동안 워커 전체가 멈춰
+    다른 사용자 요청까지 대기하게 됨 (requests는 monkey patch로 이미 협력적으로 동작)
+    wsgi.py가 app import 전에 patch_all()을 실행하므로 이 시점에 패치 여부를 알 수 있음
+    """
+    try:
+        from gevent import monkey
+        if not monkey.is_module_patched("socket"):
+            return
+        from grpc.experimental import gevent as grpc_gevent
+        grpc_gevent.init_gevent()
+        logger.info("gRPC gevent 모드 활성화")
+    except ImportError:
+        pass
+
+
+if VISION_IMPORT_SUCCESS:
+    _init_grpc_gevent()
+
+
+def _get_vision_client():
+    """Vision API 클라이언트 반환 (최초 호출 시 생성)
+
+    gRPC 채널은 fork 이후에 만들어야 하므로 --preload 마스터가 아닌 워커의 첫 호출 시점에 생성
+    (동시 첫 호출로 클라이언트가 두 번 만들어져도 무해하므로 잠금 없이 처리 -
+    gevent 워커에서 잠금을 쥔 채 I/O로 양보하면 워커가 멈출 수 있음)
+    """
+    global _vision_client
+    if _vision_client is None:
+        _vision_client = vision.ImageAnnotatorClient()
+    return _vision_client
+
+
+def has_cached_ocr_result(image_url: str) -> bool:
+    """같은 URL의 OCR 결과가 캐시에 있는지 확인 (있으면 즉시 응답 가능)"""
+    return _get_cached_result(_ocr_cache_key(unquote(image_url).encode('utf-8'))) is not None
+
 
 def is_vision_api_available() -> bool:
     """Vision API 사용 가능 여부 확인"""
@@ -30,8 +196,52 @@ def is_vision_api_available() -> bool:
     return can_use_vision_api()
 
 
-def download_image(image_url: str) -> bytes:
-    """이미지 다운로드 (여러 방법 시도)"""
+# 이미지 다운로드 시 한 번에 읽을 크기
+IMAGE_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class _ImageTooLarge(Exception):
+    """다운로드할 이미지가 IMAGE_DOWNLOAD_MAX_BYTES를 넘는 경우"""
+
+
+class _DownloadBudgetExceeded(Exception):
+    """이미지 다운로드가 IMAGE_DOWNLOAD_BUDGET을 넘은 경우"""
+
+
+def _iter_image_chunks(response):
+    """응답 본문 청크 반복 (urllib3 2.2+는 read1로 도착한 만큼 바로 반환해 제한 시간을 자주 확인)
+
+    iter_content는 청크 크기가 찰 때까지 기다리므로 느리게 오는 응답에서 제한 시간 확인이 늦어짐
+    """
+    read1 = getattr(response.raw, "read1", None)
+    if read1 is None:
+        yield from response.iter_content(IMAGE_DOWNLOAD_CHUNK_SIZE)
+        return
+    while True:
+        chunk = read1(IMAGE_DOWNLOAD_CHUNK_SIZE, decode_content=True)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _read_image_body(response, deadline: float) -> bytes:
+    """응답 본문을 청크 단위로 읽어 반환 (최대 크기/전체 제한 시간을 넘으면 즉시 중단)"""
+    content_length = response.headers.get('Content-Length')
+    if content_length and content_length.isdigit() and int(content_length) > IMAGE_DOWNLOAD_MAX_BYTES:
+        raise _ImageTooLarge(content_length)
+
+    body = bytearray()
+    for chunk in _iter_image_chunks(response):
+        body += chunk
+        if len(body) > IMAGE_DOWNLOAD_MAX_BYTES:
+            raise _ImageTooLarge(len(body))
+        if time.monotonic() > deadline:
+            raise _DownloadBudgetExceeded(len(body))
+    return bytes(body)
+
+
+def download_image(image_url: str, deadline: float = None) -> bytes:
+    """이미지 다운로드 (여러 방법 시도, deadline은 호출 측 전체 제한 시각 - time.monotonic 기준)"""
     decoded_url = unquote(image_url)
 
     # 다양한 헤더 조합 시도
@@ -50,20 +260,43 @@ def download_image(image_url: str) -> bytes:
         },
     ]
 
+    # 모든 헤더 조합 시도가 하나의 제한 시간을 공유 (카카오 스킬 응답 시간 안에 Vision 호출까지 마치도록)
+    # 시도별 연결/읽기 제한 시간도 남은 시간으로 줄이므로, 읽기 도중 멈춰도 최대 한 번의 읽기 대기만큼만 초과
+    download_deadline = time.monotonic() + IMAGE_DOWNLOAD_BUDGET
+    deadline = download_deadline if deadline is None else min(deadline, download_deadline)
+    connect_timeout, read_timeout = IMAGE_DOWNLOAD_TIMEOUT
+
     for headers in header_options:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.warning("이미지 다운로드 제한 시간 초과, URL 직접 사용")
+            return None
         try:
-            response = requests.get(
+            # 본문은 스트리밍으로 읽어 큰 이미지를 통째로 메모리에 올리지 않음
+            with _http_session.get(
                 decoded_url,
                 headers=headers,
-                timeout=15,
+                timeout=(min(connect_timeout, remaining), min(read_timeout, remaining)),
                 verify=True,
-                allow_redirects=True
-            )
-            if response.status_code == 200 and len(response.content) > 1000:
-                logger.info(f"이미지 다운로드 성공: {len(response.content)} bytes")
-                return response.content
+                allow_redirects=True,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    logger.warning(f"이미지 다운로드 실패: HTTP {response.status_code}")
+                    continue
+                content = _read_image_body(response, deadline)
+            if len(content) > 1000:
+                logger.info(f"이미지 다운로드 성공: {len(content)} bytes")
+                return content
             else:
-                logger.warning(f"이미지 다운로드 실패: HTTP {response.status_code}, size={len(response.content)}")
+                logger.warning(f"이미지 다운로드 실패: HTTP {response.status_code}, size={len(content)}")
+        except _ImageTooLarge as e:
+            # 다른 헤더로 받아도 크기는 같으므로 중단하고 Vision API가 URL로 직접 읽도록 함
+            logger.warning(f"이미지가 너무 큼 ({e} bytes), URL 직접 사용")
+            return None
+        except _DownloadBudgetExceeded as e:
+            logger.warning(f"이미지 다운로드 제한 시간 초과 ({e} bytes 수신), URL 직접 사용")
+            return None
         except Exception as e:
             logger.warning(f"이미지 다운로드 시도 실패: {e}")
             continue
@@ -90,6 +323,16 @@ def extract_food_type_from_image(image_url: str) -> dict:
             'message': 'Vision API 모듈이 설치되지 않았습니다.'
         }
 
+    # 다운로드부터 Vision API 응답까지 하나의 제한 시간 안에서 처리 (카카오 스킬 응답 제한 5초)
+    deadline = time.monotonic() + IMAGE_ANALYSIS_BUDGET
+
+    # 같은 URL로 이미 분석한 결과가 있으면 재사용
+    url_key = _ocr_cache_key(unquote(image_url).encode('utf-8'))
+    cached = _get_cached_result(url_key)
+    if cached:
+        logger.info("OCR 캐시 사용 (URL)")
+        return cached
+
     # Vision API 사용 가능 여부 확인
     if not can_use_vision_api():
         return {
@@ -101,13 +344,18 @@ def extract_food_type_from_image(image_url: str) -> dict:
     try:
         logger.info(f"이미지 분석 시작: {image_url[:100]}...")
 
-        # Google Cloud Vision 클라이언트 초기화
-        client = vision.ImageAnnotatorClient()
-
         # 방법 1: 이미지 다운로드 후 분석
-        image_content = download_image(image_url)
+        image_content = download_image(image_url, deadline)
+        cache_keys = [url_key]
 
         if image_content:
+            # URL이 달라도 같은 이미지면 이전 결과 재사용
+            content_key = _ocr_cache_key(image_content)
+            cached = _get_cached_result(content_key)
+            if cached:
+                logger.info("OCR 캐시 사용 (이미지 해시)")
+                return _cache_result([url_key], cached)
+            cache_keys.append(content_key)
             image = vision.Image(content=image_content)
         else:
             # 방법 2: URL 직접 사용 (공개 URL인 경우)
@@ -116,8 +364,16 @@ def extract_food_type_from_image(image_url: str) -> dict:
             image = vision.Image()
             image.source.image_uri = decoded_url
 
-        # OCR 수행
-        response = client.text_detection(image=image)
+        # OCR 수행 (재사용 클라이언트로 연결 유지, 다운로드 후 남은 시간 안에서만 호출/재시도)
+        vision_timeout = min(VISION_API_TIMEOUT, deadline - time.monotonic())
+        if vision_timeout <= 0:
+            raise google_exceptions.DeadlineExceeded("이미지 분석 제한 시간 초과 (다운로드 후 남은 시간 없음)")
+        response = _get_vision_client().text_detection(
+            image=image,
+            retry=VISION_RETRY.with_deadline(vision_timeout),
+            timeout=vision_timeout,
+            metadata=VISION_RESPONSE_METADATA
+        )
 
         if response.error.message:
             logger.error(f"Vision API 오류: {response.error.message}")
@@ -130,11 +386,11 @@ def extract_food_type_from_image(image_url: str) -> dict:
         texts = response.text_annotations
         if not texts:
             logger.warning("이미지에서 텍스트를 찾을 수 없습니다.")
-            return {
+            return _cache_result(cache_keys, {
                 'success': False,
                 'food_type': None,
                 'message': '이미지에서 텍스트를 찾을 수 없습니다.'
-            }
+            })
 
         # 전체 텍스트 추출
         full_text = texts[0].description
@@ -148,19 +404,37 @@ def extract_food_type_from_image(image_url: str) -> dict:
 
         if food_type:
             logger.info(f"추출된 식품유형: {food_type}")
-            return {
+            return _cache_result(cache_keys, {
                 'success': True,
                 'food_type': food_type,
                 'message': f"식품유형 '{food_type}'을(를) 찾았습니다."
-            }
+            })
         else:
             logger.warning("식품유형을 찾을 수 없습니다.")
-            return {
+            return _cache_result(cache_keys, {
                 'success': False,
                 'food_type': None,
                 'message': '이미지에서 식품유형을 찾을 수 없습니다.'
-            }
+            })
 
+    except google_exceptions.ResourceExhausted as e:
+        # 요청 한도 초과 (429): 재시도해도 응답 제한 시간 안에 성공하기 어려우므로 바로 안내
+        logger.warning(f"Vision API 요청 한도 초과: {e}")
+        return {
+            'success': False,
+            'food_type': None,
+            'message': (
+                '이미지 인식 요청이 많습니다. 잠시 후 다시 시도하거나 식품유형을 직접 입력해주세요.\n'
+                f'(이번 달 남은 이미지 인식 횟수: {get_vision_api_remaining()}회)'
+            )
+        }
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Vision API 시간 초과: {e}")
+        return {
+            'success': False,
+            'food_type': None,
+            'message': '이미지 분석 시간이 초과되었습니다. 식품유형을 직접 입력해주세요.'
+        }
     except Exception as e:
         logger.error(f"Vision API 오류: {e}")
         return {
@@ -176,23 +450,13 @@ def extract_food_type_from_text(ocr_text: str) -> str:
         return None
 
     try:
-        # 식품유형 패턴 매칭
-        patterns = [
-            r'식품유형\s*[:\s]*([^\n\r,]+)',
-            r'식품의\s*유형\s*[:\s]*([^\n\r,]+)',
-            r'식품의\s*종류\s*[:\s]*([^\n\r,]+)',
-            r'식품종류\s*[:\s]*([^\n\r,]+)',
-            r'품목유형\s*[:\s]*([^\n\r,]+)',
-            r'제품유형\s*[:\s]*([^\n\r,]+)',
-            r'유\s*형\s*[:\s]*([^\n\r,]+)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, ocr_text)
+        # 식품유형 패턴 매칭 (우선순위 순서대로)
+        for pattern in FOOD_TYPE_PATTERNS:
+            match = pattern.search(ocr_text)
             if match:
                 food_type = match.group(1).strip()
                 # 불필요한 문자 제거
-                food_type = re.sub(r'[^\w가-힣\s]', '', food_type).strip()
+                food_type = FOOD_TYPE_CLEANUP_PATTERN.sub('', food_type).strip()
                 # 너무 긴 경우 첫 단어만
                 if len(food_type) > 20:
                     food_type = food_type.split()[0] if food_type.split() else food_type[:20]
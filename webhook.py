@@ -14,6 +14,10 @@ WEBHOOK_SECRET = os.environ.get('GITHUB_WEBHOOK_SECRET', 'your-webhook-secret-he
 DEPLOY_SCRIPT = '/home/biofl/kakaochatbot/deploy.sh'
 ALLOWED_BRANCHES = ['main', 'master', 'claude/fix-image-analysis-error-TN7ai', 'claude/inspection-card-carousel-Qjngy', 'claude/add-qa-learning-QYLeC', 'claude/fix-kakao-chatbot-dZ3pq']
 
+# HMAC 키 패딩은 모듈 로드 시 한 번만 수행하고 요청마다 복사해서 사용
+_WEBHOOK_SECRET_BYTES = WEBHOOK_SECRET.encode('utf-8')
+_HMAC_TEMPLATE = hmac.new(_WEBHOOK_SECRET_BYTES, digestmod=hashlib.sha256)
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -30,16 +34,18 @@ app = Flask(__name__)
 
 def verify_signature(payload_body, signature_header):
     """GitHub webhook signature 검증"""
-    if not signature_header:
+    if not signature_header or not signature_header.startswith('sha256='):
+        return False
+
+    # 헤더의 hex 서명을 바이트로 변환 (형식 오류면 HMAC 계산 없이 거부)
+    try:
+        received_digest = bytes.fromhex(signature_header[7:])
+    except ValueError:
         return False
 
-    hash_object = hmac.new(
-        WEBHOOK_SECRET.encode('utf-8'),
-        msg=payload_body,
-        digestmod=hashlib.sha256
-    )
-    expected_signature = "sha256=" + hash_object.hexdigest()
-    return hmac.compare_digest(expected_signature, signature_header)
+    hash_object = _HMAC_TEMPLATE.copy()
+    hash_object.update(payload_body)
+    return hmac.compare_digest(hash_object.digest(), received_digest)
 
 
 @app.route('/webhook', methods=['POST'])
@@ -0,0 +1,21 @@
+"""
+WSGI 진입점 (운영 서버용)
+- gunicorn --preload 로 실행하면 DB 초기화가 마스터 프로세스에서 한 번만 수행됨
+
+실행 예:
+    gunicorn -k gevent -w 1 --worker-connections 1000 --preload --bind 0.0.0.0:5000 wsgi:app
+
+※ 사용자 대화 상태(user_state)가 프로세스 메모리에 저장되므로 워커는 1개로 유지하고
+  gevent로 동시 요청을 처리합니다.
+※ --preload는 마스터에서 app(requests/ssl 등)을 import하므로, 워커의 monkey patch로는 늦음
+  (ssl이 패치되지 않아 HTTPS 호출이 RecursionError로 실패) -> 다른 import보다 먼저 패치
+"""
+try:
+    from gevent import monkey
+    monkey.patch_all()
+except ImportError:
+    pass
+
+from app import app, prepare_app  # noqa: E402
+
+prepare_app()